@@ -13,6 +13,8 @@ import pytest
 from wurzel.cli._main import complete_step_import
 
 
+# Wall-clock thresholds: keep these on a single xdist worker so they never time each other
+@pytest.mark.xdist_group("performance")
 class TestAutocompletionPerformance:
     """Test CLI autocompletion performance to prevent regressions."""
 
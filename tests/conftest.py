@@ -12,6 +12,8 @@ from pydantic import BaseModel
 
 log = getLogger(__name__)
 
+TEST_DATA_DIR = Path(__file__).parent / "data"
+
 
 class SetEnv:
     def __init__(self):
@@ -42,6 +44,24 @@ class SetEnv:
             self.set(k, v)
 
 
+@pytest.fixture(scope="session")
+def place_test_data():
+    """Copy a file from `tests/data` to `dst`, reading each source file only once per session.
+
+    Copies rather than links, so a step writing to or chmod-ing its input never
+    touches the committed fixture.
+    """
+    cache: dict[str, bytes] = {}
+
+    def _place(name: str, dst: Path) -> Path:
+        if name not in cache:
+            cache[name] = (TEST_DATA_DIR / name).read_bytes()
+        dst.write_bytes(cache[name])
+        return dst
+
+    return _place
+
+
 @pytest.fixture
 def env():
     setenv = SetEnv()
@@ -145,6 +145,7 @@ class TestGenerate:
         manifest = _manifest(
             "dvc",
             steps=[{"name": "src", "class": "wurzel.steps.manual_markdown.ManualMarkdownStep", "settings": {"FOLDER_PATH": "./data"}}],
+            backend_config={"dvc": {"dataDir": str(tmp_path / "data")}},
         )
         output = tmp_path / "dvc.yaml"
         ManifestGenerator(manifest).generate(output)
@@ -84,6 +84,22 @@ def test_from_name_routes_to_spacy():
     assert isinstance(splitter, SpacySentenceSplitter)
 
 
+@pytest.mark.skipif(spacy_missing, reason="spacy or model not installed")
+def test_from_name_reuses_loaded_spacy_model():
+    first = SentenceSplitter.from_name(spacy_default_model_name)
+    second = SentenceSplitter.from_name(spacy_default_model_name)
+    assert first is not second
+    assert first._nlp is second._nlp
+
+
+@pytest.mark.skipif(spacy_missing, reason="spacy or model not installed")
+def test_spacy_model_only_runs_sentence_components():
+    splitter = SentenceSplitter.from_name(spacy_default_model_name)
+    assert "parser" in splitter._nlp.pipe_names
+    assert "ner" not in splitter._nlp.pipe_names
+    assert "ner" in splitter._nlp.disabled
+
+
 @pytest.mark.skipif(spacy_missing, reason="spacy or model not installed")
 def test_spacy_sentence_splitter_simple():
     # Simple test
@@ -19,8 +19,8 @@ from wurzel.utils.splitters.semantic_splitter import (
 )
 
 
-@pytest.fixture(scope="function")
-def Splitter(env):
+@pytest.fixture(scope="session")
+def Splitter():
     yield SemanticSplitter(
         token_limit_min=16,  # we use a non-default minimum to have shorter test cases
     )
@@ -48,13 +48,13 @@ def assert_splitter_outputs(Splitter, fixture_path: Path, save_actual_output: bo
         assert x.md == mdformat.text(expected_output_text).strip(), "incorrect split content"
 
 
-@pytest.fixture(scope="function")
-def Splitter(env):
+@pytest.fixture(scope="session")
+def Splitter():
     yield SemanticSplitter()
 
 
-@pytest.fixture(scope="function")
-def SplitterDontRepeatHeader(env):
+@pytest.fixture(scope="session")
+def SplitterDontRepeatHeader():
     yield SemanticSplitter(repeat_table_header_row=False)
 
 
@@ -4,8 +4,6 @@
 
 # Standard library imports
 import logging
-import shutil
-from pathlib import Path
 
 import pytest
 
@@ -15,7 +13,6 @@ if not HAS_LANGCHAIN_CORE or not HAS_REQUESTS or not HAS_SPACY or not HAS_TIKTOK
     pytest.skip("Embedding dependencies (langchain-core, requests, spacy, tiktoken) are not available", allow_module_level=True)
 
 from wurzel.exceptions import StepFailed
-from wurzel.executors import BaseStepExecutor
 
 # Local application/library specific imports
 from wurzel.steps import EmbeddingStep
@@ -23,7 +20,9 @@ from wurzel.steps.embedding.huggingface import HuggingFaceInferenceAPIEmbeddings
 from wurzel.steps.embedding.step_multivector import EmbeddingMultiVectorStep
 
 
-def test_embedding_step(mock_embedding, default_embedding_data, env, splitter_tokenizer_model, sentence_splitter_model):
+def test_embedding_step(
+    mock_embedding, default_embedding_data, executor, env, monkeypatch, splitter_tokenizer_model, sentence_splitter_model
+):
     """Tests the execution of the `EmbeddingStep` with a mock input file.
 
     Parameters
@@ -38,18 +37,22 @@ def test_embedding_step(mock_embedding, default_embedding_data, env, splitter_to
     Asserts that the `embedding.csv` file is created in the output folder.
 
     """
-    env.set("EMBEDDINGSTEP__API", "https://example-embedding.com/embed")
-    env.set("EMBEDDINGSTEP__TOKEN_COUNT_MIN", "64")
-    env.set("EMBEDDINGSTEP__TOKEN_COUNT_MAX", "256")
-    env.set("EMBEDDINGSTEP__TOKEN_COUNT_BUFFER", "32")
-    env.set("EMBEDDINGSTEP__TOKENIZER_MODEL", splitter_tokenizer_model)
-    env.set("EMBEDDINGSTEP__SENTENCE_SPLITTER_MODEL", sentence_splitter_model)
-
-    EmbeddingStep._select_embedding = mock_embedding
+    env.update(
+        {
+            "EMBEDDINGSTEP__API": "https://example-embedding.com/embed",
+            "EMBEDDINGSTEP__TOKEN_COUNT_MIN": "64",
+            "EMBEDDINGSTEP__TOKEN_COUNT_MAX": "256",
+            "EMBEDDINGSTEP__TOKEN_COUNT_BUFFER": "32",
+            "EMBEDDINGSTEP__TOKENIZER_MODEL": splitter_tokenizer_model,
+            "EMBEDDINGSTEP__SENTENCE_SPLITTER_MODEL": sentence_splitter_model,
+        }
+    )
+
+    monkeypatch.setattr(EmbeddingStep, "_select_embedding", mock_embedding)
     input_folder, output_folder = default_embedding_data
-    step_res = BaseStepExecutor(dont_encapsulate=False).execute_step(EmbeddingStep, [input_folder], output_folder)
+    step_res = executor.execute_step(EmbeddingStep, [input_folder], output_folder)
     assert output_folder.is_dir()
-    assert len(list(output_folder.glob("*"))) > 0
+    assert any(output_folder.iterdir())
 
     step_output, step_report = step_res[0]
 
@@ -57,15 +60,15 @@ def test_embedding_step(mock_embedding, default_embedding_data, env, splitter_to
     assert step_report.results == 11, "Step report has wrong count of outputs."
 
 
-def test_mutlivector_embedding_step(mock_embedding, tmp_path, env):
+def test_mutlivector_embedding_step(mock_embedding, default_embedding_data, executor, env, monkeypatch):
     """Tests the execution of the `EmbeddingMultiVectorStep` with a mock input file.
 
     Parameters
     ----------
     mock_embedding : MockEmbedding
         The mock embedding fixture.
-    tmp_path : pathlib.Path
-        A pytest fixture that provides a temporary directory unique to the test invocation.
+    default_embedding_data : tuple[pathlib.Path, pathlib.Path]
+        Input folder containing the mock markdown file and the output folder.
 
     Asserts
     -------
@@ -73,20 +76,14 @@ def test_mutlivector_embedding_step(mock_embedding, tmp_path, env):
 
     """
     env.set("EMBEDDINGMULTIVECTORSTEP__API", "https://example-embedding.com/embed")
-    EmbeddingStep._select_embedding = mock_embedding
-    EmbeddingMultiVectorStep._select_embedding = mock_embedding
-    EmbeddingStep._select_embedding = mock_embedding
-    mock_file = Path("tests/data/markdown.json")
-    input_folder = tmp_path / "input"
-    input_folder.mkdir()
-    shutil.copy(mock_file, input_folder)
-    output_folder = tmp_path / "out"
-    BaseStepExecutor(dont_encapsulate=False).execute_step(EmbeddingMultiVectorStep, [input_folder], output_folder)
+    monkeypatch.setattr(EmbeddingMultiVectorStep, "_select_embedding", mock_embedding)
+    input_folder, output_folder = default_embedding_data
+    executor.execute_step(EmbeddingMultiVectorStep, [input_folder], output_folder)
     assert output_folder.is_dir()
-    assert len(list(output_folder.glob("*"))) > 0
+    assert any(output_folder.iterdir())
 
 
-def test_inheritance(env, default_embedding_data):
+def test_inheritance(env, default_embedding_data, executor):
     env.set("INHERITEDSTEP__API", "https://example-embedding.com/embed")
     EXPECTED_EXCEPTION = "1234-exepected-4321"
 
@@ -97,28 +94,31 @@ def test_inheritance(env, default_embedding_data):
 
     inp, out = default_embedding_data
     with pytest.raises(StepFailed) as sf:
-        with BaseStepExecutor() as ex:
-            ex(InheritedStep, [inp], out)
+        executor(InheritedStep, [inp], out)
     assert sf.value.message.endswith(EXPECTED_EXCEPTION)
 
 
 def test_embedding_step_log_statistics(
-    mock_embedding, default_embedding_data, env, caplog, splitter_tokenizer_model, sentence_splitter_model
+    mock_embedding, default_embedding_data, executor, env, monkeypatch, caplog, splitter_tokenizer_model, sentence_splitter_model
 ):
     """Tests the logging of descriptive statistics in the `EmbeddingStep` with a mock input file."""
-    env.set("EMBEDDINGSTEP__API", "https://example-embedding.com/embed")
-    env.set("EMBEDDINGSTEP__NUM_THREADS", "1")  # Ensure deterministic behavior with single thread
-    env.set("EMBEDDINGSTEP__TOKEN_COUNT_MIN", "64")
-    env.set("EMBEDDINGSTEP__TOKEN_COUNT_MAX", "256")
-    env.set("EMBEDDINGSTEP__TOKEN_COUNT_BUFFER", "32")
-    env.set("EMBEDDINGSTEP__TOKENIZER_MODEL", splitter_tokenizer_model)
-    env.set("EMBEDDINGSTEP__SENTENCE_SPLITTER_MODEL", sentence_splitter_model)
-
-    EmbeddingStep._select_embedding = mock_embedding
+    env.update(
+        {
+            "EMBEDDINGSTEP__API": "https://example-embedding.com/embed",
+            "EMBEDDINGSTEP__NUM_THREADS": "1",  # Ensure deterministic behavior with single thread
+            "EMBEDDINGSTEP__TOKEN_COUNT_MIN": "64",
+            "EMBEDDINGSTEP__TOKEN_COUNT_MAX": "256",
+            "EMBEDDINGSTEP__TOKEN_COUNT_BUFFER": "32",
+            "EMBEDDINGSTEP__TOKENIZER_MODEL": splitter_tokenizer_model,
+            "EMBEDDINGSTEP__SENTENCE_SPLITTER_MODEL": sentence_splitter_model,
+        }
+    )
+
+    monkeypatch.setattr(EmbeddingStep, "_select_embedding", mock_embedding)
     input_folder, output_folder = default_embedding_data
 
     with caplog.at_level(logging.INFO):
-        BaseStepExecutor(dont_encapsulate=False).execute_step(EmbeddingStep, [input_folder], output_folder)
+        executor.execute_step(EmbeddingStep, [input_folder], output_folder)
 
     # check if output log exists
     assert "Distribution of char length" in caplog.text, "Missing log output for char length"
@@ -126,19 +126,13 @@ def test_embedding_step_log_statistics(
     assert "Distribution of chunks count" in caplog.text, "Missing log output for chunks count"
 
     # check extras
-    char_length_record = None
-    token_length_record = None
-    chunks_count_record = None
-
+    records = {"char length": None, "token length": None, "chunks count": None}
     for record in caplog.records:
-        if "Distribution of char length" in record.message:
-            char_length_record = record
-
-        if "Distribution of token length" in record.message:
-            token_length_record = record
-
-        if "Distribution of chunks count" in record.message:
-            chunks_count_record = record
+        for name in records:
+            if f"Distribution of {name}" in record.message:
+                records[name] = record
+                break
+    char_length_record, token_length_record, chunks_count_record = records.values()
 
     expected_char_length_count = 11
 
@@ -5,7 +5,6 @@
 import re
 
 import pytest
-import requests_mock
 from pydantic_core import Url
 
 from wurzel.utils import HAS_LANGCHAIN_CORE, HAS_REQUESTS
@@ -16,8 +15,7 @@ if not HAS_LANGCHAIN_CORE or not HAS_REQUESTS:
 from tests.steps.embedding.conftest import (
     GET_RESULT_INFO_DICT,
     GET_RESULT_INFO_STR,
-    POST_RESULT_EMBEDDING_STR,
-    embedding_service_mock,  # noqa: F401
+    register_embedding_service,
 )
 from wurzel.exceptions import (
     EmbeddingAPIException,
@@ -29,25 +27,41 @@ from wurzel.steps.embedding import (
 
 GenericEmbedding = HuggingFaceInferenceAPIEmbeddings
 
+# Matches every model name, so PrefixedAPIEmbeddings always resolves an (empty) prefix
+ANY_MODEL_PATTERN = re.compile(r".")
 
-FOR_EACH_EMBEDDING_CLASS = pytest.mark.parametrize(
-    "EmbeddingClass,ConstKwargs",
-    [
-        (
-            PrefixedAPIEmbeddings,
-            {
-                "url": "https://example.localhost.de",
-                "prefix_mapping": {re.compile(r"."): ""},
-            },
-        ),
-        (
-            HuggingFaceInferenceAPIEmbeddings,
-            {
-                "url": "https://example.localhost.de",
-            },
-        ),
-    ],
-)
+
+EMBEDDING_CASES = {
+    "prefixed": (
+        PrefixedAPIEmbeddings,
+        {
+            "url": "https://example.localhost.de",
+            "prefix_mapping": {ANY_MODEL_PATTERN: ""},
+        },
+    ),
+    "huggingface": (
+        HuggingFaceInferenceAPIEmbeddings,
+        {
+            "url": "https://example.localhost.de",
+        },
+    ),
+}
+
+
+@pytest.fixture(params=EMBEDDING_CASES.values(), ids=EMBEDDING_CASES.keys())
+def embedding_case(request) -> tuple[type[GenericEmbedding], dict]:
+    """Runs a test once for each embedding class with its constructor kwargs."""
+    return request.param
+
+
+@pytest.fixture
+def EmbeddingClass(embedding_case) -> type[GenericEmbedding]:
+    return embedding_case[0]
+
+
+@pytest.fixture
+def ConstKwargs(embedding_case) -> dict:
+    return embedding_case[1]
 
 
 def validate_embedding(embedding):
@@ -56,16 +70,14 @@ def validate_embedding(embedding):
     assert isinstance(embedding[0], float)
 
 
-@FOR_EACH_EMBEDDING_CLASS
-def init_test(EmbeddingClass: type[HuggingFaceInferenceAPIEmbeddings], ConstKwargs):
+def test_init(EmbeddingClass: type[GenericEmbedding], ConstKwargs, embedding_service_mock):
     _ = EmbeddingClass(**ConstKwargs)
 
 
-@FOR_EACH_EMBEDDING_CLASS
 def test_documents_for_each(
     EmbeddingClass: type[GenericEmbedding],
     ConstKwargs,
-    embedding_service_mock,  # noqa: F811
+    embedding_service_mock,
 ):
     e = EmbeddingClass(**ConstKwargs)
     b = e.embed_documents(["aa", "bb"])
@@ -74,18 +86,16 @@ def test_documents_for_each(
         validate_embedding(emb)
 
 
-@FOR_EACH_EMBEDDING_CLASS
 def test_embedd_query_for_each(
     EmbeddingClass: type[GenericEmbedding],
     ConstKwargs,
-    embedding_service_mock,  # noqa: F811
+    embedding_service_mock,
 ):
     e = EmbeddingClass(**ConstKwargs)
     a = e.embed_query("aa")
     validate_embedding(a)
 
 
-@FOR_EACH_EMBEDDING_CLASS
 def test_not_existent_embedding_service(EmbeddingClass: type[GenericEmbedding], ConstKwargs):
     class PrefixedAPIEmbeddingsMocked(EmbeddingClass):
         _timeout = 0.2
@@ -98,48 +108,36 @@ def test_not_existent_embedding_service(EmbeddingClass: type[GenericEmbedding],
         embedding.embed_query("This has to be emebedded")
 
 
-@FOR_EACH_EMBEDDING_CLASS
-def test_invalid_embedding_contructor(EmbeddingClass: type[GenericEmbedding], ConstKwargs):
-    with requests_mock.Mocker() as m:
-        m.get("/info", text="invalid")
-        m.post("/embed", text="invalid")
-        with pytest.raises(EmbeddingAPIException):
-            EmbeddingClass(**ConstKwargs)
+def test_invalid_embedding_contructor(EmbeddingClass: type[GenericEmbedding], ConstKwargs, http_mock):
+    register_embedding_service(http_mock, info="invalid", embed="invalid")
+    with pytest.raises(EmbeddingAPIException):
+        EmbeddingClass(**ConstKwargs)
 
 
-@FOR_EACH_EMBEDDING_CLASS
-def test_invalid_embedding_request(EmbeddingClass: type[GenericEmbedding], ConstKwargs):
-    with requests_mock.Mocker() as m:
-        m.get("/info", text=GET_RESULT_INFO_STR % "test")
-        m.post("/embed", text=POST_RESULT_EMBEDDING_STR)
-        em = EmbeddingClass(**ConstKwargs)
-        m.get("/info", text='{"msg":"invalid"')
-        m.post("/embed", text='{"msg":"invalid"')
-        with pytest.raises(EmbeddingAPIException):
-            em.embed_query("nope")
+def test_invalid_embedding_request(EmbeddingClass: type[GenericEmbedding], ConstKwargs, http_mock):
+    register_embedding_service(http_mock, info=GET_RESULT_INFO_STR % "test")
+    em = EmbeddingClass(**ConstKwargs)
+    register_embedding_service(http_mock, info='{"msg":"invalid"', embed='{"msg":"invalid"')
+    with pytest.raises(EmbeddingAPIException):
+        em.embed_query("nope")
 
 
-@FOR_EACH_EMBEDDING_CLASS
-def test_service_status_code_failure(EmbeddingClass: type[GenericEmbedding], ConstKwargs):
-    with requests_mock.Mocker() as m:
-        m.get("/info", text=GET_RESULT_INFO_STR % "e5")
-        m.post("/embed", text=POST_RESULT_EMBEDDING_STR, status_code=500)
-        em = EmbeddingClass(**ConstKwargs)
-        with pytest.raises(EmbeddingAPIException):
-            em.embed_documents(["asd"])
+def test_service_status_code_failure(EmbeddingClass: type[GenericEmbedding], ConstKwargs, http_mock):
+    register_embedding_service(http_mock, info=GET_RESULT_INFO_STR % "e5", embed_status_code=500)
+    em = EmbeddingClass(**ConstKwargs)
+    with pytest.raises(EmbeddingAPIException):
+        em.embed_documents(["asd"])
 
 
 @pytest.mark.parametrize("port", [None, 1234])
 @pytest.mark.parametrize("scheme", ["http", "https"])
-def test_url_schema(scheme: str, port):
+def test_url_schema(scheme: str, port, http_mock):
     url_str = f"{scheme}://example.com.local"
     if port:
         url_str += f":{port}"
     url = Url(url_str)
-    with requests_mock.Mocker() as m:
-        m.get("/info", text=GET_RESULT_INFO_STR % "e5")
-        m.post("/embed", text=POST_RESULT_EMBEDDING_STR, status_code=500)
-        assert str(url) == f"{url_str}/"
-        hgf = HuggingFaceInferenceAPIEmbeddings(str(url))
+    register_embedding_service(http_mock, info=GET_RESULT_INFO_STR % "e5", embed_status_code=500)
+    assert str(url) == f"{url_str}/"
+    hgf = HuggingFaceInferenceAPIEmbeddings(str(url))
     assert hgf.info_url.port == port if port else {"http": 80, "https": 443}.get(scheme)
     assert str(hgf.info_url) == f"{url_str}/info"
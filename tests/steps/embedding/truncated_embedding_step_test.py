@@ -8,7 +8,6 @@ from wurzel.utils import HAS_LANGCHAIN_CORE, HAS_REQUESTS, HAS_SPACY, HAS_TIKTOK
 if not HAS_LANGCHAIN_CORE or not HAS_REQUESTS or not HAS_SPACY or not HAS_TIKTOKEN:
     pytest.skip("Embedding dependencies (langchain-core, requests, spacy, tiktoken) are not available", allow_module_level=True)
 
-from wurzel.executors import BaseStepExecutor
 from wurzel.steps.embedding.step import TruncatedEmbeddingStep
 
 
@@ -23,7 +22,15 @@ from wurzel.steps.embedding.step import TruncatedEmbeddingStep
     ],
 )
 def test_truncated_embedding_step(
-    token_count_max, mean_text_length, mock_embedding, default_embedding_data, env, splitter_tokenizer_model, sentence_splitter_model
+    token_count_max,
+    mean_text_length,
+    mock_embedding,
+    default_embedding_data,
+    executor,
+    env,
+    monkeypatch,
+    splitter_tokenizer_model,
+    sentence_splitter_model,
 ):
     """Tests the execution of the `TruncatedEmbeddingStep` with a mock input file and check total output count and mean length of texts.
 
@@ -39,18 +46,22 @@ def test_truncated_embedding_step(
     Asserts that the `embedding.csv` file is created in the output folder.
 
     """
-    env.set("TRUNCATEDEMBEDDINGSTEP__API", "https://example-embedding.com/embed")
-    env.set("TRUNCATEDEMBEDDINGSTEP__TOKEN_COUNT_MIN", "64")
-    env.set("TRUNCATEDEMBEDDINGSTEP__TOKEN_COUNT_MAX", str(token_count_max))
-    env.set("TRUNCATEDEMBEDDINGSTEP__TOKEN_COUNT_BUFFER", "32")
-    env.set("TRUNCATEDEMBEDDINGSTEP__TOKENIZER_MODEL", splitter_tokenizer_model)
-    env.set("TRUNCATEDEMBEDDINGSTEP__SENTENCE_SPLITTER_MODEL", sentence_splitter_model)
-
-    TruncatedEmbeddingStep._select_embedding = mock_embedding
+    env.update(
+        {
+            "TRUNCATEDEMBEDDINGSTEP__API": "https://example-embedding.com/embed",
+            "TRUNCATEDEMBEDDINGSTEP__TOKEN_COUNT_MIN": "64",
+            "TRUNCATEDEMBEDDINGSTEP__TOKEN_COUNT_MAX": str(token_count_max),
+            "TRUNCATEDEMBEDDINGSTEP__TOKEN_COUNT_BUFFER": "32",
+            "TRUNCATEDEMBEDDINGSTEP__TOKENIZER_MODEL": splitter_tokenizer_model,
+            "TRUNCATEDEMBEDDINGSTEP__SENTENCE_SPLITTER_MODEL": sentence_splitter_model,
+        }
+    )
+
+    monkeypatch.setattr(TruncatedEmbeddingStep, "_select_embedding", mock_embedding)
     input_folder, output_folder = default_embedding_data
-    step_res = BaseStepExecutor(dont_encapsulate=False).execute_step(TruncatedEmbeddingStep, [input_folder], output_folder)
+    step_res = executor.execute_step(TruncatedEmbeddingStep, [input_folder], output_folder)
     assert output_folder.is_dir()
-    assert len(list(output_folder.glob("*"))) > 0
+    assert any(output_folder.iterdir())
 
     step_output, step_report = step_res[0]
 
@@ -3,7 +3,6 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-import shutil
 from pathlib import Path
 
 import pytest
@@ -41,20 +40,20 @@ def milvus_lite(tmp_path: Path, env):
 #     shutil.copytree(MILV_OUT_DIR / "logs", f"./reports/logs/{test_name}")
 
 
-def test_milvus_connector_first(input_output_folder: tuple[Path, Path], milvus_lite):
+def test_milvus_connector_first(input_output_folder: tuple[Path, Path], milvus_lite, place_test_data):
     input_path, output_path = input_output_folder
     input_file = input_path / "milvus_at.csv"
     output_file = output_path / "MilvusConnectorStep"
-    shutil.copy("./tests/data/embedded.csv", input_file)
+    place_test_data("embedded.csv", input_file)
     BaseStepExecutor().execute_step(MilvusConnectorStep, {input_file}, output_file)
 
 
-def test_milvus_connector_has_previous(input_output_folder: tuple[Path, Path], milvus_lite):
+def test_milvus_connector_has_previous(input_output_folder: tuple[Path, Path], milvus_lite, place_test_data):
     input_path, output_path = input_output_folder
 
     input_file = input_path / "milvus_at.csv"
     output_file = output_path / "MilvusConnectorStep"
-    shutil.copy("./tests/data/embedded.csv", input_file)
+    place_test_data("embedded.csv", input_file)
     BaseStepExecutor().execute_step(MilvusConnectorStep, {input_file}, output_file)
     BaseStepExecutor().execute_step(MilvusConnectorStep, {input_file}, output_file)
 
@@ -66,11 +65,11 @@ def test_milvus_connector_no_csv(input_output_folder: tuple[Path, Path], milvus_
         BaseStepExecutor().execute_step(MilvusConnectorStep, {input_path}, output_file)
 
 
-def test_milvus_connector_one_no_csv(input_output_folder: tuple[Path, Path], milvus_lite):
+def test_milvus_connector_one_no_csv(input_output_folder: tuple[Path, Path], milvus_lite, place_test_data):
     input_path, output_path = input_output_folder
     input_file = input_path / "milvus_at.csv"
     output_file = output_path / "MilvusConnectorStep"
-    shutil.copy("./tests/data/embedded.csv", input_file)
+    place_test_data("embedded.csv", input_file)
     with pytest.raises(StepFailed):
         BaseStepExecutor().execute_step(
             MilvusConnectorStep,
@@ -79,32 +78,30 @@ def test_milvus_connector_one_no_csv(input_output_folder: tuple[Path, Path], mil
         )
 
 
-def test_milvus_collection_retirement(input_output_folder: tuple[Path, Path], env, milvus_lite):
+def test_milvus_collection_retirement(input_output_folder: tuple[Path, Path], env, milvus_lite, place_test_data):
     input_path, output_path = input_output_folder
     env.set("MILVUS__COLLECTION_HISTORY_LEN", "3")
     input_file = input_path / "milvus_at.csv"
     output_file = output_path / "MilvusConnectorStep"
-    shutil.copy("./tests/data/embedded.csv", input_file)
+    place_test_data("embedded.csv", input_file)
     with BaseStepExecutor() as ex:
-        ex(MilvusConnectorStep, {input_file}, output_file)
-        ex(MilvusConnectorStep, {input_file}, output_file)
-        ex(MilvusConnectorStep, {input_file}, output_file)
-        # this will cover retire
-        ex(MilvusConnectorStep, {input_file}, output_file)
+        # the fourth run exceeds the history length and covers retire
+        for _ in range(4):
+            ex(MilvusConnectorStep, {input_file}, output_file)
 
 
-def test_milvus_connector_csv_partially_not_same_shape(input_output_folder: tuple[Path, Path], milvus_lite):
+def test_milvus_connector_csv_partially_not_same_shape(input_output_folder: tuple[Path, Path], milvus_lite, place_test_data):
     input_path, output_path = input_output_folder
     output_file = output_path / "MilvusConnectorStep"
     input_file = input_path / "milvus_at.csv"
-    shutil.copy("./tests/data/embedded_broken.csv", input_file)
+    place_test_data("embedded_broken.csv", input_file)
     with pytest.raises(StepFailed):
         BaseStepExecutor().execute_step(MilvusConnectorStep, {input_file}, output_file)
 
 
-def test_milvus_connector_true_csv(input_output_folder: tuple[Path, Path], milvus_lite):
+def test_milvus_connector_true_csv(input_output_folder: tuple[Path, Path], milvus_lite, place_test_data):
     input_path, output_path = input_output_folder
     input_file = input_path / "milvus_at.csv"
     output_file = output_path / MilvusConnectorStep.__name__
-    shutil.copy("./tests/data/embedded.csv", input_file)
+    place_test_data("embedded.csv", input_file)
     BaseStepExecutor().execute_step(MilvusConnectorStep, {input_file}, output_file)
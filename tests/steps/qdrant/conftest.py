@@ -9,7 +9,9 @@ from wurzel.utils import HAS_QDRANT
 if not HAS_QDRANT:
     pytest.skip("Qdrant is not available", allow_module_level=True)
 
-pytest.importorskip("pymilvus")
+from qdrant_client import QdrantClient
+
+from wurzel.steps.qdrant.retirement import CollectionRetirer
 
 
 @pytest.fixture(scope="function", autouse=True)
@@ -25,3 +27,32 @@ def qdrant_url(env):
 def dummy_collection(env, autouse=True):
     env.set("QDRANTCONNECTORSTEP__COLLECTION", "dummy")
     env.set("QDRANTCONNECTORMULTIVECTORSTEP__COLLECTION", "dummy")
+
+
+@pytest.fixture(scope="session")
+def shared_qdrant_client():
+    """In-memory Qdrant client shared by all Qdrant tests of a session (or xdist worker).
+
+    Steps close their client when they are garbage collected, so `close` is
+    disabled while the session runs and only called on teardown.
+    """
+    client = QdrantClient(location=":memory:")
+    close = client.close
+    client.close = lambda **kwargs: None
+    yield client
+    close()
+
+
+@pytest.fixture
+def qdrant_client(shared_qdrant_client, monkeypatch):
+    """Empty shared in-memory client, injected into every Qdrant step created in the test."""
+    for collection in shared_qdrant_client.get_collections().collections:
+        shared_qdrant_client.delete_collection(collection.name)
+    monkeypatch.setattr("wurzel.steps.qdrant.step.QdrantClient", lambda **kwargs: shared_qdrant_client)
+    return shared_qdrant_client
+
+
+@pytest.fixture
+def no_telemetry(monkeypatch):
+    """Qdrant reports no collection telemetry, so retirement falls back to versions and aliases only."""
+    monkeypatch.setattr(CollectionRetirer, "_get_telemetry", lambda self, details_level: [])
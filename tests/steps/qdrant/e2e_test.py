@@ -2,9 +2,7 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-
-import shutil
-import unittest.mock
+from functools import cache
 from pathlib import Path
 
 import pytest
@@ -21,49 +19,55 @@ from wurzel.steps.qdrant.data import QdrantMultiVectorResult, QdrantResult
 from wurzel.utils import HAS_TLSH
 
 
-def test_qdrant_connector_first(input_output_folder: tuple[Path, Path], dummy_collection):
+@cache
+def _schema_columns(result_type: type[QdrantResult]) -> tuple[str, ...]:
+    """Column names of `result_type`'s pandera schema, built once per result type."""
+    return tuple(result_type.to_schema().columns)
+
+
+def test_qdrant_connector_first(input_output_folder: tuple[Path, Path], dummy_collection, qdrant_client, no_telemetry, place_test_data):
     input_path, output_path = input_output_folder
     input_file = input_path / "qdrant_at.csv"
     output_file = output_path / "QdrantConnectorStep"
-    shutil.copy("./tests/data/embedded.csv", input_file)
-    with unittest.mock.patch("wurzel.steps.qdrant.retirement.CollectionRetirer._get_telemetry", return_value=[]):
-        with BaseStepExecutor() as ex:
-            step_res = ex(QdrantConnectorStep, {input_path}, output_file)
+    place_test_data("embedded.csv", input_file)
+    with BaseStepExecutor() as ex:
+        step_res = ex(QdrantConnectorStep, {input_path}, output_file)
 
-            step_output, step_report = step_res[0]
+        step_output, step_report = step_res[0]
 
-            assert step_report.results == 2, "Invalid step results"
-            assert step_output["collection"][1] == "dummy_v1", "Invalid step output in collection name"
-            assert step_output["metadata"][0]["foo"] == "bar", "Invalid step output in metadata"
+        assert step_report.results == 2, "Invalid step results"
+        assert step_output["collection"][1] == "dummy_v1", "Invalid step output in collection name"
+        assert step_output["metadata"][0]["foo"] == "bar", "Invalid step output in metadata"
 
 
-def test_qdrant_connector_has_previous(input_output_folder: tuple[Path, Path], dummy_collection):
+def test_qdrant_connector_has_previous(
+    input_output_folder: tuple[Path, Path], dummy_collection, qdrant_client, no_telemetry, place_test_data
+):
     input_path, output_path = input_output_folder
 
     input_file = input_path / "qdrant_at.csv"
     output_file = output_path / "QdrantConnectorStep"
-    shutil.copy("./tests/data/embedded.csv", input_file)
-    with unittest.mock.patch("wurzel.steps.qdrant.retirement.CollectionRetirer._get_telemetry", return_value=[]):
-        all_outputs = []
+    place_test_data("embedded.csv", input_file)
+    all_outputs = []
+    with BaseStepExecutor() as ex:
         for _ in range(3):
-            result = BaseStepExecutor().execute_step(QdrantConnectorStep, {input_path}, output_file)
-            outputs, _ = zip(*result)
-            all_outputs.extend(outputs)
-        assert len(all_outputs) == 3
+            result = ex(QdrantConnectorStep, {input_path}, output_file)
+            all_outputs.extend(output for output, _ in result)
+    assert len(all_outputs) == 3
 
 
-def test_qdrant_connector_no_csv(input_output_folder: tuple[Path, Path]):
+def test_qdrant_connector_no_csv(input_output_folder: tuple[Path, Path], qdrant_client):
     input_path, output_path = input_output_folder
     output_file = output_path / "QdrantConnectorStep"
     with pytest.raises(StepFailed):
         BaseStepExecutor().execute_step(QdrantConnectorStep, {input_path}, output_file)
 
 
-def test_qdrant_connector_one_no_csv(input_output_folder: tuple[Path, Path]):
+def test_qdrant_connector_one_no_csv(input_output_folder: tuple[Path, Path], qdrant_client, place_test_data):
     input_path, output_path = input_output_folder
     input_file = input_path / "qdrant_at.csv"
     output_file = output_path / "QdrantConnectorStep"
-    shutil.copy("./tests/data/embedded.csv", input_file)
+    place_test_data("embedded.csv", input_file)
     with pytest.raises(StepFailed):
         BaseStepExecutor().execute_step(
             QdrantConnectorStep,
@@ -74,11 +78,13 @@ def test_qdrant_connector_one_no_csv(input_output_folder: tuple[Path, Path]):
 
 def test_qdrant_connector_csv_partially_not_same_shape(
     input_output_folder: tuple[Path, Path],
+    qdrant_client,
+    place_test_data,
 ):
     input_path, output_path = input_output_folder
     output_file = output_path / "QdrantConnectorStep"
     input_file = input_path / "qdrant_at.csv"
-    shutil.copy("./tests/data/embedded_broken.csv", input_file)
+    place_test_data("embedded_broken.csv", input_file)
     with pytest.raises(StepFailed):
         BaseStepExecutor().execute_step(QdrantConnectorStep, {input_path}, output_file)
 
@@ -89,39 +95,39 @@ def test_qdrant_connector_csv_partially_not_same_shape(
         pytest.param(
             QdrantConnectorMultiVectorStep,
             QdrantMultiVectorResult,
-            "./tests/data/embedding_multi.csv",
+            "embedding_multi.csv",
             id="MultiVector",
         ),
         pytest.param(
             QdrantConnectorStep,
             QdrantResult,
-            "./tests/data/embedded.csv",
+            "embedded.csv",
             id="SingleVector",
         ),
     ],
 )
-@pytest.mark.parametrize("tlsh", [True, False])
+@pytest.mark.parametrize("tlsh", [pytest.param(True, marks=pytest.mark.skipif(not HAS_TLSH, reason="TLSH dep is not installed")), False])
 def test_qdrant_connector_true_csv(
     input_output_folder: tuple[Path, Path],
     dummy_collection,
+    qdrant_client,
+    no_telemetry,
     step: type[QdrantConnectorStep | QdrantConnectorMultiVectorStep],
     result_type: QdrantResult | QdrantMultiVectorResult,
     inpt_file: str,
     tlsh: bool,
+    place_test_data,
 ):
     input_path, output_path = input_output_folder
     input_file = input_path / "qdrant_at.csv"
     output_file = output_path / step.__name__
-    shutil.copy(inpt_file, input_file)
-
-    with unittest.mock.patch("wurzel.steps.qdrant.retirement.CollectionRetirer._get_telemetry", return_value=[]):
-        res = BaseStepExecutor().execute_step(step, {input_path}, output_file)
-        expected_cols = list(result_type.to_schema().columns)
-        if tlsh and not HAS_TLSH:
-            pytest.skip("TLSH dep is not installed")
-        if not tlsh:
-            expected_cols.remove("text_tlsh_hash")
-        data, rep = res[0]
-        assert res
-        for col in expected_cols:
-            assert col in data
+    place_test_data(inpt_file, input_file)
+
+    res = BaseStepExecutor().execute_step(step, {input_path}, output_file)
+    expected_cols = list(_schema_columns(result_type))
+    if not tlsh:
+        expected_cols.remove("text_tlsh_hash")
+    data, rep = res[0]
+    assert res
+    for col in expected_cols:
+        assert col in data
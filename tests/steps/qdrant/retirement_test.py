@@ -2,9 +2,8 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-import shutil
-import unittest.mock
 from datetime import UTC, datetime, timedelta
+from functools import cache
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -17,7 +16,7 @@ if not HAS_QDRANT:
 
 from dateutil.parser import isoparse
 from pydantic import ValidationError
-from qdrant_client import QdrantClient, models
+from qdrant_client import models
 from qdrant_client.models import AliasDescription, CollectionsAliasesResponse
 
 from wurzel.executors import BaseStepExecutor
@@ -31,6 +30,29 @@ from wurzel.steps.qdrant.telemetry import (
     ReplicaSetTelemetry,
 )
 
+# Last usage timestamps relative to the start of the test session: OLD_TIME is past the retention period, RECENT_TIME is not
+_NOW = datetime.now(UTC)
+OLD_TIME = (_NOW - timedelta(days=10)).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+RECENT_TIME = (_NOW - timedelta(hours=6)).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+DUMMY_VECTORS_CONFIG = models.VectorParams(size=100, distance=models.Distance.COSINE)
+
+
+@cache
+def _collection_telemetry(col_id: str, last_used: str) -> CollectionTelemetry:
+    """Telemetry of a single collection last used at `last_used`; built once and shared between test cases."""
+    return CollectionTelemetry(
+        id=col_id,
+        shards=[
+            ReplicaSetTelemetry(
+                local=LocalShardTelemetry(
+                    optimizations=OptimizerTelemetry(optimizations=OperationStats(last_responded=isoparse(last_used)))
+                ),
+                remote=[],
+            )
+        ],
+    )
+
 
 @pytest.mark.parametrize(
     "hist_len, step_run, aliased_collections,recently_used ,count_remaining_collection, remaining_collections,"
@@ -119,6 +141,9 @@ def test_qdrant_collection_retirement_with_missing_versions(
     untracked_collection,
     dry_run,
     enable_collection_retirement,
+    place_test_data,
+    qdrant_client,
+    monkeypatch,
 ):
     input_path, output_path = input_output_folder
     env.set("COLLECTION_HISTORY_LEN", str(hist_len))
@@ -127,103 +152,59 @@ def test_qdrant_collection_retirement_with_missing_versions(
 
     input_file = input_path / "qdrant_at.csv"
     output_file = output_path / "QdrantConnectorStep"
-    shutil.copy("./tests/data/embedded.csv", input_file)
-
-    client = QdrantClient(location=":memory:")
-    old_close = client.close
-    client.close = print
+    place_test_data("embedded.csv", input_file)
 
-    old_time = (datetime.now(UTC) - timedelta(days=10)).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
-    recent_time = (datetime.now(UTC) - timedelta(hours=6)).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
-
-    collection_data = [(col_id, recent_time if col_id in recently_used else old_time) for col_id in remaining_collections]
-
-    mock_telemetry = [
-        CollectionTelemetry(
-            id=col_id,
-            shards=[
-                ReplicaSetTelemetry(
-                    local=LocalShardTelemetry(
-                        optimizations=OptimizerTelemetry(optimizations=OperationStats(last_responded=isoparse(last_used)))
-                    ),
-                    remote=[],
-                )
-            ],
-        )
-        for col_id, last_used in collection_data
-    ]
+    recent = frozenset(recently_used)
+    mock_telemetry = [_collection_telemetry(col_id, RECENT_TIME if col_id in recent else OLD_TIME) for col_id in remaining_collections]
 
     mock_aliases = CollectionsAliasesResponse(
         aliases=[AliasDescription(alias_name=col, collection_name=col) for col in aliased_collections]
     )
 
-    with unittest.mock.patch("wurzel.steps.qdrant.retirement.CollectionRetirer._get_telemetry", return_value=mock_telemetry):
-        with unittest.mock.patch("wurzel.steps.qdrant.step.QdrantClient.get_aliases", return_value=mock_aliases):
-            with unittest.mock.patch("wurzel.steps.qdrant.step.QdrantClient") as mock:
-                mock.return_value = client
-                if untracked_collection:
-                    for untracked in untracked_collection:
-                        client.create_collection(untracked, vectors_config={"size": 1, "distance": "Cosine"})
+    for untracked in untracked_collection:
+        qdrant_client.create_collection(untracked, vectors_config={"size": 1, "distance": "Cosine"})
 
-                with BaseStepExecutor() as ex:
-                    for _ in range(step_run):
-                        ex(QdrantConnectorStep, {input_path}, output_file)
+    monkeypatch.setattr(CollectionRetirer, "_get_telemetry", lambda self, details_level: mock_telemetry)
+    monkeypatch.setattr(qdrant_client, "get_aliases", lambda: mock_aliases)
 
-                client.close = old_close
-                remaining = [col.name for col in client.get_collections().collections]
-                assert len(remaining) == count_remaining_collection
-                assert remaining == remaining_collections
-                for aliased in aliased_collections:
-                    assert aliased in remaining
-                for recent_used in recently_used:
-                    assert recent_used in remaining
-                for untracked in untracked_collection:
-                    assert untracked in remaining
+    with BaseStepExecutor() as ex:
+        for _ in range(step_run):
+            ex(QdrantConnectorStep, {input_path}, output_file)
 
+    remaining = [col.name for col in qdrant_client.get_collections().collections]
+    assert len(remaining) == count_remaining_collection
+    assert remaining == remaining_collections
+    for aliased in aliased_collections:
+        assert aliased in remaining
+    for recent_used in recently_used:
+        assert recent_used in remaining
+    for untracked in untracked_collection:
+        assert untracked in remaining
 
-def test_qdrant_get_collections_with_ephemerals(input_output_folder: tuple[Path, Path], env, dummy_collection):
-    input_path, output_path = input_output_folder
+
+def test_qdrant_get_collections_with_ephemerals(env, dummy_collection, qdrant_client):
     HIST_LEN = 3
     env.set("COLLECTION_HISTORY_LEN", str(HIST_LEN))
     env.set("COLLECTION", "tenant1-dev")
-    input_file = input_path / "qdrant_at.csv"
-    shutil.copy("./tests/data/embedded.csv", input_file)
-    client = QdrantClient(location=":memory:")
-    {
-        client.create_collection(
-            coll,
-            vectors_config=models.VectorParams(size=100, distance=models.Distance.COSINE),
-        )
-        for coll in [
-            "tenant1-dev_v1",
-            "tenant1-dev_v2",
-            "tenant1-dev_v3",
-            "tenant1-dev-feature-abc_v1",
-        ]
-    }
+    for coll in ("tenant1-dev_v1", "tenant1-dev_v2", "tenant1-dev_v3", "tenant1-dev-feature-abc_v1"):
+        qdrant_client.create_collection(coll, vectors_config=DUMMY_VECTORS_CONFIG)
 
-    client.close = print
-    with unittest.mock.patch("wurzel.steps.qdrant.step.QdrantClient") as mock:
-        mock.return_value = client
-        step = QdrantConnectorStep()
-        result = step._get_collection_versions()
-        assert len(result) == 3
-        assert set(result.keys()) == {1, 2, 3}
+    step = QdrantConnectorStep()
+    result = step._get_collection_versions()
+    assert len(result) == 3
+    assert set(result.keys()) == {1, 2, 3}
 
-        env.set("COLLECTION", "tenant1-dev-feature-abc")
-        step = QdrantConnectorStep()
-        result = step._get_collection_versions()
-        assert len(result) == 1
-        assert set(result.keys()) == {1}
+    env.set("COLLECTION", "tenant1-dev-feature-abc")
+    step = QdrantConnectorStep()
+    result = step._get_collection_versions()
+    assert len(result) == 1
+    assert set(result.keys()) == {1}
 
 
-def test_get_telemetry_success(env, dummy_collection):
+def test_get_telemetry_success(env, dummy_collection, qdrant_client):
     """Test successful telemetry fetch from Qdrant."""
     env.set("COLLECTION", "dummy")
 
-    client = QdrantClient(location=":memory:")
-    client.close = print
-
     mock_response_data = {
         "result": {
             "collections": {
@@ -245,27 +226,25 @@ def test_get_telemetry_success(env, dummy_collection):
     mock_response.json.return_value = mock_response_data
     mock_response.raise_for_status.return_value = None
 
-    with patch("wurzel.steps.qdrant.step.QdrantClient") as mock_client:
-        mock_client.return_value = client
-        with patch("wurzel.steps.qdrant.retirement.requests.get", return_value=mock_response) as mock_get:
-            step = QdrantConnectorStep()
-            retirer = CollectionRetirer(step.client, step.settings)
-            result = retirer._get_telemetry(details_level=3)
-            mock_get.assert_called_once()
-            call_args = mock_get.call_args
-            assert call_args[0][0] == "http://localhost:6333/telemetry?details_level=3"
-            assert "api-key" in call_args[1]["headers"]
-            assert "timeout" in call_args[1]
-            assert call_args[1]["timeout"] > 0
-            assert isinstance(result, list)
-            assert len(result) == 1
-            assert isinstance(result[0], CollectionTelemetry)
-            assert result[0].id == "test_collection"
-            shard = (result[0].shards or [])[0]
-            assert shard.local is not None
-            assert shard.local.optimizations is not None
-            assert shard.local.optimizations.optimizations is not None
-            assert shard.local.optimizations.optimizations.last_responded is not None
+    with patch("wurzel.steps.qdrant.retirement.requests.get", return_value=mock_response) as mock_get:
+        step = QdrantConnectorStep()
+        retirer = CollectionRetirer(step.client, step.settings)
+        result = retirer._get_telemetry(details_level=3)
+        mock_get.assert_called_once()
+        call_args = mock_get.call_args
+        assert call_args[0][0] == "http://localhost:6333/telemetry?details_level=3"
+        assert "api-key" in call_args[1]["headers"]
+        assert "timeout" in call_args[1]
+        assert call_args[1]["timeout"] > 0
+        assert isinstance(result, list)
+        assert len(result) == 1
+        assert isinstance(result[0], CollectionTelemetry)
+        assert result[0].id == "test_collection"
+        shard = (result[0].shards or [])[0]
+        assert shard.local is not None
+        assert shard.local.optimizations is not None
+        assert shard.local.optimizations.optimizations is not None
+        assert shard.local.optimizations.optimizations.last_responded is not None
 
 
 @pytest.mark.parametrize(
@@ -323,27 +302,22 @@ def test_get_telemetry_success(env, dummy_collection):
         ),
     ],
 )
-def test_get_telemetry_unexpected_response(env, dummy_collection, response_body, expected_exception, expected_result):
+def test_get_telemetry_unexpected_response(env, dummy_collection, qdrant_client, response_body, expected_exception, expected_result):
     """_get_telemetry must raise ValidationError for structurally invalid responses
     and gracefully return [] for valid-but-empty ones.
     """
     env.set("COLLECTION", "dummy")
 
-    client = QdrantClient(location=":memory:")
-    client.close = print
-
     mock_response = MagicMock()
     mock_response.json.return_value = response_body
     mock_response.raise_for_status.return_value = None
 
-    with patch("wurzel.steps.qdrant.step.QdrantClient") as mock_client:
-        mock_client.return_value = client
-        with patch("wurzel.steps.qdrant.retirement.requests.get", return_value=mock_response):
-            step = QdrantConnectorStep()
-            retirer = CollectionRetirer(step.client, step.settings)
-            if expected_exception is not None:
-                with pytest.raises(expected_exception):
-                    retirer._get_telemetry(details_level=3)
-            else:
-                result = retirer._get_telemetry(details_level=3)
-                assert result == expected_result
+    with patch("wurzel.steps.qdrant.retirement.requests.get", return_value=mock_response):
+        step = QdrantConnectorStep()
+        retirer = CollectionRetirer(step.client, step.settings)
+        if expected_exception is not None:
+            with pytest.raises(expected_exception):
+                retirer._get_telemetry(details_level=3)
+        else:
+            result = retirer._get_telemetry(details_level=3)
+            assert result == expected_result
@@ -28,9 +28,13 @@ class TestQdrantSettings:
     def test_apikey_from_env_string(self, env):
         """Test that APIKEY is correctly loaded from environment variable as string."""
         test_api_key = "test-secret-key-12345"  # pragma: allowlist secret
-        env.set("QDRANTCONNECTORSTEP__COLLECTION", "test-collection")
-        env.set("QDRANTCONNECTORSTEP__URI", ":memory:")  # Use in-memory to avoid connection
-        env.set("QDRANTCONNECTORSTEP__APIKEY", test_api_key)
+        env.update(
+            {
+                "QDRANTCONNECTORSTEP__COLLECTION": "test-collection",
+                "QDRANTCONNECTORSTEP__URI": ":memory:",  # Use in-memory to avoid connection
+                "QDRANTCONNECTORSTEP__APIKEY": test_api_key,
+            }
+        )
 
         with step_env_encapsulation(QdrantConnectorStep):
             step = QdrantConnectorStep()
@@ -41,9 +45,13 @@ class TestQdrantSettings:
 
     def test_apikey_from_env_empty_string(self, env):
         """Test that APIKEY handles empty string from environment variable."""
-        env.set("QDRANTCONNECTORSTEP__COLLECTION", "test-collection")
-        env.set("QDRANTCONNECTORSTEP__URI", ":memory:")  # Use in-memory to avoid connection
-        env.set("QDRANTCONNECTORSTEP__APIKEY", "")
+        env.update(
+            {
+                "QDRANTCONNECTORSTEP__COLLECTION": "test-collection",
+                "QDRANTCONNECTORSTEP__URI": ":memory:",  # Use in-memory to avoid connection
+                "QDRANTCONNECTORSTEP__APIKEY": "",
+            }
+        )
 
         with step_env_encapsulation(QdrantConnectorStep):
             step = QdrantConnectorStep()
@@ -55,9 +63,13 @@ class TestQdrantSettings:
     def test_apikey_from_env_special_characters(self, env):
         """Test that APIKEY handles special characters in the secret."""
         test_api_key = "api-key-with-special-chars!@#$%^&*()_+-="  # pragma: allowlist secret
-        env.set("QDRANTCONNECTORSTEP__COLLECTION", "test-collection")
-        env.set("QDRANTCONNECTORSTEP__URI", ":memory:")  # Use in-memory to avoid connection
-        env.set("QDRANTCONNECTORSTEP__APIKEY", test_api_key)
+        env.update(
+            {
+                "QDRANTCONNECTORSTEP__COLLECTION": "test-collection",
+                "QDRANTCONNECTORSTEP__URI": ":memory:",  # Use in-memory to avoid connection
+                "QDRANTCONNECTORSTEP__APIKEY": test_api_key,
+            }
+        )
 
         with step_env_encapsulation(QdrantConnectorStep):
             step = QdrantConnectorStep()
@@ -100,11 +112,15 @@ class TestQdrantSettings:
 
     def test_all_settings_with_env(self, env):
         """Test loading all settings from environment variables including APIKEY."""
-        env.set("QDRANTCONNECTORSTEP__COLLECTION", "test-collection")
-        env.set("QDRANTCONNECTORSTEP__URI", ":memory:")  # Use in-memory to avoid connection
-        env.set("QDRANTCONNECTORSTEP__APIKEY", "full-test-key")
-        env.set("QDRANTCONNECTORSTEP__BATCH_SIZE", "512")
-        env.set("QDRANTCONNECTORSTEP__REPLICATION_FACTOR", "2")
+        env.update(
+            {
+                "QDRANTCONNECTORSTEP__COLLECTION": "test-collection",
+                "QDRANTCONNECTORSTEP__URI": ":memory:",  # Use in-memory to avoid connection
+                "QDRANTCONNECTORSTEP__APIKEY": "full-test-key",
+                "QDRANTCONNECTORSTEP__BATCH_SIZE": "512",
+                "QDRANTCONNECTORSTEP__REPLICATION_FACTOR": "2",
+            }
+        )
 
         with step_env_encapsulation(QdrantConnectorStep):
             step = QdrantConnectorStep()
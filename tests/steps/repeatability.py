@@ -30,6 +30,6 @@ def test_repeatability(step_cls: type[TypedStep], tmp_path: Path):
     for i in range(REPETITIONS):
         out_path = tmp_path / f"output_{step_cls.__name__}_{i}"
         step.execute([], out_path)
-        file_hash = hashlib.md5(out_path.read_bytes())
-        hashes.append(file_hash.hexdigest())
+        with out_path.open("rb") as f:
+            hashes.append(hashlib.file_digest(f, "blake2b").hexdigest())
     assert all(res_hash == hashes[0] for res_hash in hashes[1:]), "hashes do not match"
@@ -2,8 +2,8 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-import os
-import shutil
+import threading
+from functools import cache
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -24,16 +24,22 @@ from wurzel.executors.base_executor import BaseStepExecutor
 from wurzel.steps.scraperapi.step import ScraperAPIStep, UrlItem
 
 
+@cache
+def _load_html(path: Path) -> str:
+    """Scraped page fixture, read once per session."""
+    return path.read_text(encoding="utf8")
+
+
 @pytest.fixture(scope="function")
 def mock_scraper_api(requests_mock: requests_mock.Mocker, url_items, env):
     env.set("SCRAPERAPISTEP__TOKEN", "dummy token")
     requests_mock.get(
         "https://api.scraperapi.com/",
-        response_list=[{"text": open(path, encoding="utf8").read()} for _url, path in url_items],
+        response_list=[{"text": _load_html(path)} for _url, path in url_items],
     )
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def url_items() -> list[tuple[UrlItem, str]]:
     return [
         (
@@ -53,8 +59,6 @@ def url_items() -> list[tuple[UrlItem, str]]:
 
 def test_scraper_api(tmp_path: Path, mock_scraper_api, url_items):
     output = tmp_path / f"{ScraperAPIStep.__name__}"
-    os.mkdir(tmp_path / "input")
-    shutil.copy("tests/data/markdown.json", tmp_path / "input/")
     output.mkdir(parents=True, exist_ok=True)
     with BaseStepExecutor() as ex:
         result = ex(ScraperAPIStep, [[url for url, _path in url_items]], output)
@@ -66,14 +70,12 @@ def test_scraper_api(tmp_path: Path, mock_scraper_api, url_items):
 def test_scraper_api_errors(tmp_path: Path, env, url_items):
     env.set("SCRAPERAPISTEP__TOKEN", "dummy token")
     output = tmp_path / f"{ScraperAPIStep.__name__}"
-    os.mkdir(tmp_path / "input")
-    shutil.copy("tests/data/markdown.json", tmp_path / "input/")
     output.mkdir(parents=True, exist_ok=True)
     side_effects = []
     for _url, path in url_items:
         successful_response = MagicMock()
         successful_response.status_code = 200
-        successful_response.text = open(path, encoding="utf8").read()
+        successful_response.text = _load_html(path)
         side_effects.append(successful_response)
 
     side_effects += [requests.exceptions.HTTPError, requests.exceptions.ReadTimeout, requests.exceptions.ConnectionError]
@@ -81,3 +83,29 @@ def test_scraper_api_errors(tmp_path: Path, env, url_items):
     with patch("requests.Session.get", side_effect=side_effects):
         with BaseStepExecutor() as ex:
             ex(ScraperAPIStep, [[url for url, _path in url_items + url_items]], output)
+
+
+def test_scraper_api_session_per_worker_thread(tmp_path: Path, env, url_items):
+    env.set("SCRAPERAPISTEP__TOKEN", "dummy token")
+    env.set("SCRAPERAPISTEP__CONCURRENCY_NUM", "3")
+    output = tmp_path / f"{ScraperAPIStep.__name__}"
+    output.mkdir(parents=True, exist_ok=True)
+    used: set[tuple[int, int]] = set()
+    html = _load_html(url_items[0][1])
+
+    def fake_get(session, *_args, **_kwargs):
+        used.add((threading.get_ident(), id(session)))
+        response = MagicMock()
+        response.status_code = 200
+        response.text = html
+        return response
+
+    with patch.object(requests.Session, "get", autospec=True, side_effect=fake_get):
+        with BaseStepExecutor() as ex:
+            result = ex(ScraperAPIStep, [[url for url, _path in url_items + url_items]], output)
+
+    assert len(result[0][0]) == 6
+    # every worker thread sticks to one session, and no session is shared between threads
+    threads = {thread for thread, _session in used}
+    sessions = {session for _thread, session in used}
+    assert len(used) == len(threads) == len(sessions)
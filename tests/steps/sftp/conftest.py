@@ -0,0 +1,41 @@
+# SPDX-FileCopyrightText: 2025 Deutsche Telekom AG (opensource@telekom.de)
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from wurzel.utils import HAS_PARAMIKO
+
+if not HAS_PARAMIKO:
+    pytest.skip("Paramiko is not available", allow_module_level=True)
+
+import paramiko
+
+
+@pytest.fixture(scope="session")
+def _sftp_client_mock():
+    return MagicMock(spec=paramiko.SFTPClient)
+
+
+@pytest.fixture(scope="session")
+def _transport_mock():
+    transport = MagicMock(spec=paramiko.Transport)
+    transport.connect = MagicMock()
+    transport.close = MagicMock()
+    return transport
+
+
+@pytest.fixture
+def mock_sftp_client(_sftp_client_mock):
+    """Mock SFTP client, built once per session and reset for every test."""
+    _sftp_client_mock.reset_mock(return_value=True, side_effect=True)
+    return _sftp_client_mock
+
+
+@pytest.fixture
+def mock_transport(_transport_mock):
+    """Mock Transport object, built once per session and reset for every test."""
+    _transport_mock.reset_mock(return_value=True, side_effect=True)
+    return _transport_mock
@@ -5,22 +5,20 @@
 """Comprehensive tests for SFTPManualMarkdownStep."""
 
 import stat
+from contextlib import ExitStack, contextmanager
+from functools import cache
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 
 import pytest
 
-# Check if paramiko is available
-try:
-    import paramiko
-
-    HAS_PARAMIKO = True
-except ImportError:
-    HAS_PARAMIKO = False
+from wurzel.utils import HAS_PARAMIKO
 
 if not HAS_PARAMIKO:
     pytest.skip("Paramiko is not available", allow_module_level=True)
 
+import paramiko
 from pydantic import SecretStr
 
 from wurzel.datacontract import MarkdownDataContract
@@ -44,24 +42,35 @@ Content here."""
 MARKDOWN_NO_METADATA = """# Simple Markdown
 No metadata here."""
 
+# SFTP files are read as bytes, so encode the shared fixtures once
+MARKDOWN_WITH_METADATA_BYTES = MARKDOWN_WITH_METADATA.encode("utf-8")
+MARKDOWN_WITHOUT_URL_BYTES = MARKDOWN_WITHOUT_URL.encode("utf-8")
+MARKDOWN_NO_METADATA_BYTES = MARKDOWN_NO_METADATA.encode("utf-8")
+
 
-# Mock classes for SFTP objects
-class MockSFTPAttributes:
+# Mock SFTP objects
+def sftp_attributes(filename: str, is_dir: bool = False) -> SimpleNamespace:
     """Mock SFTP file attributes."""
+    return SimpleNamespace(filename=filename, st_mode=stat.S_IFDIR if is_dir else stat.S_IFREG)
+
 
-    def __init__(self, filename: str, is_dir: bool = False):
-        self.filename = filename
-        self.st_mode = stat.S_IFDIR if is_dir else stat.S_IFREG
+# Directory listings shared by the tests; the step only reads them
+TEST_MD_LISTING = [sftp_attributes("test.md")]
+ROOT_WITH_SUBDIR_LISTING = [sftp_attributes("file1.md"), sftp_attributes("subdir", is_dir=True)]
+SUBDIR_LISTING = [sftp_attributes("file2.md")]
+MIXED_FILES_LISTING = [sftp_attributes("file.md"), sftp_attributes("file.txt"), sftp_attributes("file.pdf")]
 
 
 class MockSFTPFile:
     """Mock SFTP file object."""
 
-    def __init__(self, content: str):
-        self.content = content.encode("utf-8")
+    def __init__(self, content: str | bytes):
+        self.content = content
         self._closed = False
 
     def read(self):
+        if isinstance(self.content, str):
+            self.content = self.content.encode("utf-8")
         return self.content
 
     def close(self):
@@ -74,28 +83,55 @@ class MockSFTPFile:
         self.close()
 
 
-@pytest.fixture
-def mock_sftp_client():
-    """Mock SFTP client."""
-    return MagicMock(spec=paramiko.SFTPClient)
+_CONNECTION_SETTINGS = {"HOST": "test.example.com", "USERNAME": "testuser", "REMOTE_PATH": "/remote/path"}
+_BASE_SETTINGS = {**_CONNECTION_SETTINGS, "PASSWORD": SecretStr("testpass")}
+
+
+@cache
+def _settings(**kwargs) -> SFTPManualMarkdownSettings:
+    """Validated settings, shared by all tests using the same arguments (the step never mutates them)."""
+    return SFTPManualMarkdownSettings(**kwargs)
+
+
+def _mock_result(result) -> dict:
+    """Patch kwargs making a mock raise `result` if it is an exception, else return it."""
+    return {"side_effect": result} if isinstance(result, BaseException) else {"return_value": result}
+
+
+@contextmanager
+def paramiko_patches(transport, sftp_client, **key_loaders):
+    """Route paramiko connections of the step to the given mocks.
+
+    Args:
+        transport: Returned by `paramiko.Transport(...)`.
+        sftp_client: Returned (or raised, if an exception) by `paramiko.SFTPClient.from_transport`.
+        **key_loaders: Key class name (e.g. `RSAKey`) to the key returned (or exception raised) by its `from_private_key_file`.
 
+    Yields:
+        dict[str, MagicMock]: The patched callables, keyed by `Transport` and the key class names.
+    """
+    with ExitStack() as stack:
+        mocks = {"Transport": stack.enter_context(patch("paramiko.Transport", return_value=transport))}
+        stack.enter_context(patch("paramiko.SFTPClient.from_transport", **_mock_result(sftp_client)))
+        for key_cls, result in key_loaders.items():
+            mocks[key_cls] = stack.enter_context(patch(f"paramiko.{key_cls}.from_private_key_file", **_mock_result(result)))
+        yield mocks
 
-@pytest.fixture
-def mock_transport():
-    """Mock Transport object."""
-    transport = MagicMock(spec=paramiko.Transport)
-    transport.connect = MagicMock()
-    transport.close = MagicMock()
-    return transport
+
+@pytest.fixture(scope="module", autouse=True)
+def _bypass_step_init():
+    """Skip the step's settings loading for the whole module; tests assign settings directly."""
+    init_patch = patch.object(SFTPManualMarkdownStep, "__init__", lambda self: None)
+    init_patch.start()
+    yield
+    init_patch.stop()
 
 
 def create_step_with_settings(settings: SFTPManualMarkdownSettings) -> SFTPManualMarkdownStep:
     """Helper to create a step with given settings, bypassing normal initialization."""
-    with patch.object(SFTPManualMarkdownSettings, "model_validate", return_value=settings):
-        with patch.object(SFTPManualMarkdownStep, "__init__", lambda self: None):
-            step = SFTPManualMarkdownStep()
-            step.settings = settings
-            return step
+    step = SFTPManualMarkdownStep()
+    step.settings = settings
+    return step
 
 
 class TestMetadataParsing:
@@ -104,10 +140,10 @@ class TestMetadataParsing:
     @pytest.mark.parametrize(
         "markdown_content,expected_keywords,expected_url_contains,check_keywords_exact",
         [
-            (MARKDOWN_WITH_METADATA, "test,markdown", "test/file.md", True),
-            (MARKDOWN_WITHOUT_URL, "test,markdown", "/remote/path/test.md", True),
+            (MARKDOWN_WITH_METADATA_BYTES, "test,markdown", "test/file.md", True),
+            (MARKDOWN_WITHOUT_URL_BYTES, "test,markdown", "/remote/path/test.md", True),
             # For no metadata, keywords will be temp filename, so we just check it's not empty
-            (MARKDOWN_NO_METADATA, None, "/remote/path/test.md", False),
+            (MARKDOWN_NO_METADATA_BYTES, None, "/remote/path/test.md", False),
         ],
     )
     def test_metadata_parsing(
@@ -120,30 +156,24 @@ class TestMetadataParsing:
         mock_sftp_client,
     ):
         """Test parsing of YAML metadata in markdown files."""
-        settings = SFTPManualMarkdownSettings(
-            HOST="test.example.com",
-            USERNAME="testuser",
-            PASSWORD=SecretStr("testpass"),
-            REMOTE_PATH="/remote/path",
-        )
+        settings = _settings(**_BASE_SETTINGS)
 
         # Setup mock SFTP responses
-        mock_sftp_client.listdir_attr.return_value = [MockSFTPAttributes("test.md", is_dir=False)]
+        mock_sftp_client.listdir_attr.return_value = TEST_MD_LISTING
         mock_sftp_client.open.return_value = MockSFTPFile(markdown_content)
 
-        with patch("paramiko.Transport", return_value=mock_transport):
-            with patch("paramiko.SFTPClient.from_transport", return_value=mock_sftp_client):
-                step = create_step_with_settings(settings)
-                results = step.run(None)
+        with paramiko_patches(mock_transport, mock_sftp_client):
+            step = create_step_with_settings(settings)
+            results = step.run(None)
 
-                assert len(results) == 1
-                assert isinstance(results[0], MarkdownDataContract)
-                if check_keywords_exact:
-                    assert results[0].keywords == expected_keywords
-                else:
-                    # When no metadata, keywords defaults to temp filename (not empty)
-                    assert results[0].keywords != ""
-                assert expected_url_contains in results[0].url
+            assert len(results) == 1
+            assert isinstance(results[0], MarkdownDataContract)
+            if check_keywords_exact:
+                assert results[0].keywords == expected_keywords
+            else:
+                # When no metadata, keywords defaults to temp filename (not empty)
+                assert results[0].keywords != ""
+            assert expected_url_contains in results[0].url
 
 
 class TestAuthentication:
@@ -151,87 +181,55 @@ class TestAuthentication:
 
     def test_password_authentication(self, mock_transport, mock_sftp_client):
         """Test SFTP connection with password authentication."""
-        settings = SFTPManualMarkdownSettings(
-            HOST="test.example.com",
-            USERNAME="testuser",
-            PASSWORD=SecretStr("testpass"),
-            REMOTE_PATH="/remote/path",
-        )
+        settings = _settings(**_BASE_SETTINGS)
 
         mock_sftp_client.listdir_attr.return_value = []
 
-        with patch("paramiko.Transport", return_value=mock_transport) as mock_transport_class:
-            with patch("paramiko.SFTPClient.from_transport", return_value=mock_sftp_client):
-                step = create_step_with_settings(settings)
-
-                # Should raise StepFailed when no files found
-                with pytest.raises(StepFailed, match="No Markdown files found"):
-                    step.run(None)
-
-                # Verify Transport was created with correct host/port
-                mock_transport_class.assert_called_once_with(("test.example.com", 22))
-
-                # Verify connect was called with password
-                mock_transport.connect.assert_called_once()
-                call_kwargs = mock_transport.connect.call_args.kwargs
-                assert call_kwargs["username"] == "testuser"
-                assert call_kwargs["password"] == "testpass"  # pragma: allowlist secret
-                assert call_kwargs["pkey"] is None
-
-    def test_ssh_key_authentication(self, mock_transport, mock_sftp_client):
-        """Test SFTP connection with SSH key authentication."""
-        settings = SFTPManualMarkdownSettings(
-            HOST="test.example.com",
-            USERNAME="testuser",
-            PRIVATE_KEY_PATH="/path/to/key",
-            REMOTE_PATH="/remote/path",
-        )
+        with paramiko_patches(mock_transport, mock_sftp_client) as mocks:
+            step = create_step_with_settings(settings)
 
-        mock_sftp_client.listdir_attr.return_value = []
-        mock_key = MagicMock(spec=paramiko.RSAKey)
-
-        with patch("paramiko.Transport", return_value=mock_transport):
-            with patch("paramiko.SFTPClient.from_transport", return_value=mock_sftp_client):
-                with patch("paramiko.RSAKey.from_private_key_file", return_value=mock_key):
-                    step = create_step_with_settings(settings)
-
-                    # Should raise StepFailed when no files found
-                    with pytest.raises(StepFailed, match="No Markdown files found"):
-                        step.run(None)
-
-                    # Verify connect was called with key
-                    mock_transport.connect.assert_called_once()
-                    call_kwargs = mock_transport.connect.call_args.kwargs
-                    assert call_kwargs["username"] == "testuser"
-                    assert call_kwargs["pkey"] == mock_key
-                    assert call_kwargs["password"] is None
-
-    def test_key_with_passphrase(self, mock_transport, mock_sftp_client):
-        """Test SSH key loading with passphrase."""
-        settings = SFTPManualMarkdownSettings(
-            HOST="test.example.com",
-            USERNAME="testuser",
-            PRIVATE_KEY_PATH="/path/to/key",
-            PRIVATE_KEY_PASSPHRASE=SecretStr("keypass"),
-            REMOTE_PATH="/remote/path",
-        )
+            # Should raise StepFailed when no files found
+            with pytest.raises(StepFailed, match="No Markdown files found"):
+                step.run(None)
+
+            # Verify Transport was created with correct host/port
+            mocks["Transport"].assert_called_once_with(("test.example.com", 22))
+
+            # Verify connect was called with password
+            mock_transport.connect.assert_called_once_with(username="testuser", password="testpass", pkey=None)  # pragma: allowlist secret
+
+    @pytest.mark.parametrize(
+        "passphrase,failing_key_types,key_type",
+        [
+            pytest.param(None, (), "RSAKey", id="rsa"),
+            pytest.param("keypass", (), "RSAKey", id="rsa_with_passphrase"),
+            # RSA fails to load, so the step falls back to Ed25519
+            pytest.param(None, ("RSAKey",), "Ed25519Key", id="ed25519_fallback"),
+        ],
+    )
+    def test_ssh_key_authentication(self, passphrase, failing_key_types, key_type, mock_transport, mock_sftp_client):
+        """Test SFTP connection with SSH key authentication, optional passphrase and key type fallback."""
+        settings_kwargs = {"PRIVATE_KEY_PASSPHRASE": SecretStr(passphrase)} if passphrase else {}
+        settings = _settings(**_CONNECTION_SETTINGS, PRIVATE_KEY_PATH="/path/to/key", **settings_kwargs)
 
         mock_sftp_client.listdir_attr.return_value = []
-        mock_key = MagicMock(spec=paramiko.RSAKey)
+        mock_key = Mock(spec=getattr(paramiko, key_type))
+        key_loaders = {failing: paramiko.SSHException(f"Not a {failing}") for failing in failing_key_types}
 
-        with patch("paramiko.Transport", return_value=mock_transport):
-            with patch("paramiko.SFTPClient.from_transport", return_value=mock_sftp_client):
-                with patch("paramiko.RSAKey.from_private_key_file", return_value=mock_key) as mock_rsa:
-                    step = create_step_with_settings(settings)
+        with paramiko_patches(mock_transport, mock_sftp_client, **key_loaders, **{key_type: mock_key}) as mocks:
+            step = create_step_with_settings(settings)
+
+            # Should raise StepFailed when no files found
+            with pytest.raises(StepFailed, match="No Markdown files found"):
+                step.run(None)
 
-                    # Will raise StepFailed due to no files
-                    with pytest.raises(StepFailed):
-                        step.run(None)
+            # Verify the key was loaded from the configured path (string value is passed)
+            call_args = mocks[key_type].call_args
+            assert call_args[0][0] == str(Path("/path/to/key"))
+            assert call_args[1]["password"] == passphrase
 
-                    # Verify key was loaded with passphrase (string value is passed)
-                    call_args = mock_rsa.call_args
-                    assert Path(call_args[0][0]) == Path("/path/to/key")
-                    assert call_args[1]["password"] == "keypass"  # pragma: allowlist secret
+            # Verify connect was called with key
+            mock_transport.connect.assert_called_once_with(username="testuser", password=None, pkey=mock_key)
 
 
 class TestFileDiscovery:
@@ -239,224 +237,135 @@ class TestFileDiscovery:
 
     def test_recursive_file_discovery(self, mock_transport, mock_sftp_client):
         """Test recursive discovery of markdown files."""
-        settings = SFTPManualMarkdownSettings(
-            HOST="test.example.com",
-            USERNAME="testuser",
-            PASSWORD=SecretStr("testpass"),
-            REMOTE_PATH="/remote/path",
-            RECURSIVE=True,
-        )
+        settings = _settings(**_BASE_SETTINGS, RECURSIVE=True)
 
         # Mock directory structure: root has 1 file + 1 subdir, subdir has 1 file
-        root_items = [
-            MockSFTPAttributes("file1.md", is_dir=False),
-            MockSFTPAttributes("subdir", is_dir=True),
-        ]
-        subdir_items = [MockSFTPAttributes("file2.md", is_dir=False)]
-
         def listdir_side_effect(path):
             if path == "/remote/path":
-                return root_items
+                return ROOT_WITH_SUBDIR_LISTING
             elif path == "/remote/path/subdir":
-                return subdir_items
+                return SUBDIR_LISTING
             return []
 
         mock_sftp_client.listdir_attr.side_effect = listdir_side_effect
-        mock_sftp_client.open.return_value = MockSFTPFile(MARKDOWN_NO_METADATA)
+        mock_sftp_client.open.return_value = MockSFTPFile(MARKDOWN_NO_METADATA_BYTES)
 
-        with patch("paramiko.Transport", return_value=mock_transport):
-            with patch("paramiko.SFTPClient.from_transport", return_value=mock_sftp_client):
-                step = create_step_with_settings(settings)
-                results = step.run(None)
+        with paramiko_patches(mock_transport, mock_sftp_client):
+            step = create_step_with_settings(settings)
+            results = step.run(None)
 
-                # Should find files in root and subdirectory
-                assert len(results) == 2
-                assert all(isinstance(r, MarkdownDataContract) for r in results)
+            # Should find files in root and subdirectory
+            assert len(results) == 2
+            assert all(isinstance(r, MarkdownDataContract) for r in results)
 
     def test_non_recursive_file_discovery(self, mock_transport, mock_sftp_client):
         """Test non-recursive discovery (only root directory)."""
-        settings = SFTPManualMarkdownSettings(
-            HOST="test.example.com",
-            USERNAME="testuser",
-            PASSWORD=SecretStr("testpass"),
-            REMOTE_PATH="/remote/path",
-            RECURSIVE=False,
-        )
+        settings = _settings(**_BASE_SETTINGS, RECURSIVE=False)
 
         # Mock directory with file and subdir
-        root_items = [
-            MockSFTPAttributes("file1.md", is_dir=False),
-            MockSFTPAttributes("subdir", is_dir=True),
-        ]
-
-        mock_sftp_client.listdir_attr.return_value = root_items
-        mock_sftp_client.open.return_value = MockSFTPFile(MARKDOWN_NO_METADATA)
+        mock_sftp_client.listdir_attr.return_value = ROOT_WITH_SUBDIR_LISTING
+        mock_sftp_client.open.return_value = MockSFTPFile(MARKDOWN_NO_METADATA_BYTES)
 
-        with patch("paramiko.Transport", return_value=mock_transport):
-            with patch("paramiko.SFTPClient.from_transport", return_value=mock_sftp_client):
-                step = create_step_with_settings(settings)
-                results = step.run(None)
+        with paramiko_patches(mock_transport, mock_sftp_client):
+            step = create_step_with_settings(settings)
+            results = step.run(None)
 
-                # Should only find file in root, not enter subdirectory
-                assert len(results) == 1
-                assert isinstance(results[0], MarkdownDataContract)
+            # Should only find file in root, not enter subdirectory
+            assert len(results) == 1
+            assert isinstance(results[0], MarkdownDataContract)
 
     def test_filter_non_markdown_files(self, mock_transport, mock_sftp_client):
         """Test that only .md files are processed."""
-        settings = SFTPManualMarkdownSettings(
-            HOST="test.example.com",
-            USERNAME="testuser",
-            PASSWORD=SecretStr("testpass"),
-            REMOTE_PATH="/remote/path",
-        )
+        settings = _settings(**_BASE_SETTINGS)
 
         # Mix of markdown and non-markdown files
-        root_items = [
-            MockSFTPAttributes("file.md", is_dir=False),
-            MockSFTPAttributes("file.txt", is_dir=False),
-            MockSFTPAttributes("file.pdf", is_dir=False),
-        ]
-
-        mock_sftp_client.listdir_attr.return_value = root_items
-        mock_sftp_client.open.return_value = MockSFTPFile(MARKDOWN_NO_METADATA)
+        mock_sftp_client.listdir_attr.return_value = MIXED_FILES_LISTING
+        mock_sftp_client.open.return_value = MockSFTPFile(MARKDOWN_NO_METADATA_BYTES)
 
-        with patch("paramiko.Transport", return_value=mock_transport):
-            with patch("paramiko.SFTPClient.from_transport", return_value=mock_sftp_client):
-                step = create_step_with_settings(settings)
-                results = step.run(None)
+        with paramiko_patches(mock_transport, mock_sftp_client):
+            step = create_step_with_settings(settings)
+            results = step.run(None)
 
-                # Should only find .md files
-                assert len(results) == 1
+            # Should only find .md files
+            assert len(results) == 1
 
     def test_empty_directory(self, mock_transport, mock_sftp_client):
         """Test handling of empty directory."""
-        settings = SFTPManualMarkdownSettings(
-            HOST="test.example.com",
-            USERNAME="testuser",
-            PASSWORD=SecretStr("testpass"),
-            REMOTE_PATH="/remote/path",
-        )
+        settings = _settings(**_BASE_SETTINGS)
 
         mock_sftp_client.listdir_attr.return_value = []
 
-        with patch("paramiko.Transport", return_value=mock_transport):
-            with patch("paramiko.SFTPClient.from_transport", return_value=mock_sftp_client):
-                step = create_step_with_settings(settings)
+        with paramiko_patches(mock_transport, mock_sftp_client):
+            step = create_step_with_settings(settings)
 
-                # Should raise StepFailed when no files found
-                with pytest.raises(StepFailed, match="No Markdown files found"):
-                    step.run(None)
+            # Should raise StepFailed when no files found
+            with pytest.raises(StepFailed, match="No Markdown files found"):
+                step.run(None)
 
 
 class TestErrorHandling:
     """Tests for error handling in various scenarios."""
 
-    def test_connection_failure(self, mock_transport, mock_sftp_client):
-        """Test handling of connection failures."""
-        settings = SFTPManualMarkdownSettings(
-            HOST="test.example.com",
-            USERNAME="testuser",
-            PASSWORD=SecretStr("testpass"),
-            REMOTE_PATH="/remote/path",
-        )
+    @pytest.fixture(scope="class")
+    def error_step(self) -> SFTPManualMarkdownStep:
+        """Password-authenticated step shared by the error cases; run() keeps no state between calls."""
+        return create_step_with_settings(_settings(**_BASE_SETTINGS))
 
-        mock_transport.connect.side_effect = Exception("Connection failed")
-
-        with patch("paramiko.Transport", return_value=mock_transport):
-            step = create_step_with_settings(settings)
-
-            with pytest.raises(Exception, match="Connection failed"):
-                step.run(None)
-
-            # Verify cleanup was attempted
+    @pytest.mark.parametrize(
+        "failing_call,error,expected_exception,match,settings_overrides",
+        [
+            pytest.param("transport.connect", Exception("Connection failed"), Exception, "Connection failed", {}, id="connection_failure"),
+            pytest.param(
+                "transport.connect",
+                paramiko.AuthenticationException("Auth failed"),
+                paramiko.AuthenticationException,
+                None,
+                {"PASSWORD": SecretStr("wrongpass")},
+                id="authentication_failure",
+            ),
+            # File read errors raise StepFailed immediately
+            pytest.param("sftp.open", OSError("Permission denied"), StepFailed, "Failed to load markdown file", {}, id="file_read_error"),
+            # Directory access errors are logged, so no files are found
+            pytest.param(
+                "sftp.listdir_attr", OSError("Access denied"), StepFailed, "No Markdown files found", {}, id="directory_access_error"
+            ),
+            pytest.param("sftp.listdir_attr", Exception("Error during operation"), Exception, None, {}, id="unexpected_error"),
+        ],
+    )
+    def test_error_propagation(
+        self, failing_call, error, expected_exception, match, settings_overrides, error_step, mock_transport, mock_sftp_client
+    ):
+        """Test that paramiko errors surface from run and that connections are closed anyway."""
+        if settings_overrides:
+            error_step = create_step_with_settings(_settings(**{**_BASE_SETTINGS, **settings_overrides}))
+        owner, method = failing_call.split(".")
+        mock_sftp_client.listdir_attr.return_value = TEST_MD_LISTING
+        getattr({"transport": mock_transport, "sftp": mock_sftp_client}[owner], method).side_effect = error
+
+        with paramiko_patches(mock_transport, mock_sftp_client):
+            with pytest.raises(expected_exception, match=match):
+                error_step.run(None)
+
+            # Verify cleanup was attempted (the SFTP client only exists once connected)
             mock_transport.close.assert_called_once()
-
-    def test_authentication_failure(self, mock_transport, mock_sftp_client):
-        """Test handling of authentication failures."""
-        settings = SFTPManualMarkdownSettings(
-            HOST="test.example.com",
-            USERNAME="testuser",
-            PASSWORD=SecretStr("wrongpass"),
-            REMOTE_PATH="/remote/path",
-        )
-
-        mock_transport.connect.side_effect = paramiko.AuthenticationException("Auth failed")
-
-        with patch("paramiko.Transport", return_value=mock_transport):
-            step = create_step_with_settings(settings)
-
-            with pytest.raises(paramiko.AuthenticationException):
-                step.run(None)
-
-    def test_file_read_error_handling(self, mock_transport, mock_sftp_client):
-        """Test handling of file read errors (raises StepFailed immediately)."""
-        settings = SFTPManualMarkdownSettings(
-            HOST="test.example.com",
-            USERNAME="testuser",
-            PASSWORD=SecretStr("testpass"),
-            REMOTE_PATH="/remote/path",
-        )
-
-        mock_sftp_client.listdir_attr.return_value = [MockSFTPAttributes("test.md", is_dir=False)]
-        mock_sftp_client.open.side_effect = OSError("Permission denied")
-
-        with patch("paramiko.Transport", return_value=mock_transport):
-            with patch("paramiko.SFTPClient.from_transport", return_value=mock_sftp_client):
-                step = create_step_with_settings(settings)
-
-                # Should raise StepFailed with specific error message
-                with pytest.raises(StepFailed, match="Failed to load markdown file"):
-                    step.run(None)
-
-    def test_directory_access_error(self, mock_transport, mock_sftp_client):
-        """Test handling of directory access errors (logs warning and raises StepFailed)."""
-        settings = SFTPManualMarkdownSettings(
-            HOST="test.example.com",
-            USERNAME="testuser",
-            PASSWORD=SecretStr("testpass"),
-            REMOTE_PATH="/remote/path",
-        )
-
-        mock_sftp_client.listdir_attr.side_effect = OSError("Access denied")
-
-        with patch("paramiko.Transport", return_value=mock_transport):
-            with patch("paramiko.SFTPClient.from_transport", return_value=mock_sftp_client):
-                step = create_step_with_settings(settings)
-
-                # Should log warning and raise StepFailed when no files found
-                with pytest.raises(StepFailed, match="No Markdown files found"):
-                    step.run(None)
+            if owner == "sftp":
+                mock_sftp_client.close.assert_called_once()
+            else:
+                mock_sftp_client.close.assert_not_called()
 
     def test_invalid_key_file(self, mock_transport, mock_sftp_client):
         """Test handling of invalid SSH key file."""
-        settings = SFTPManualMarkdownSettings(
-            HOST="test.example.com",
-            USERNAME="testuser",
-            PRIVATE_KEY_PATH="/nonexistent/key",
-            REMOTE_PATH="/remote/path",
-        )
+        settings = _settings(**_CONNECTION_SETTINGS, PRIVATE_KEY_PATH="/nonexistent/key")
 
         mock_sftp_client.listdir_attr.return_value = []
+        key_not_found = FileNotFoundError("Key not found")
 
-        with patch("paramiko.Transport", return_value=mock_transport):
-            with patch("paramiko.SFTPClient.from_transport", return_value=mock_sftp_client):
-                with patch(
-                    "paramiko.RSAKey.from_private_key_file",
-                    side_effect=FileNotFoundError("Key not found"),
-                ):
-                    with patch(
-                        "paramiko.Ed25519Key.from_private_key_file",
-                        side_effect=FileNotFoundError("Key not found"),
-                    ):
-                        with patch(
-                            "paramiko.ECDSAKey.from_private_key_file",
-                            side_effect=FileNotFoundError("Key not found"),
-                        ):
-                            step = create_step_with_settings(settings)
-
-                            # The actual exception message is "Key not found" not "Could not load..."
-                            with pytest.raises(FileNotFoundError, match="Key not found"):
-                                step.run(None)
+        with paramiko_patches(mock_transport, mock_sftp_client, RSAKey=key_not_found, Ed25519Key=key_not_found, ECDSAKey=key_not_found):
+            step = create_step_with_settings(settings)
+
+            # The actual exception message is "Key not found" not "Could not load..."
+            with pytest.raises(FileNotFoundError, match="Key not found"):
+                step.run(None)
 
 
 class TestConnectionCleanup:
@@ -464,82 +373,20 @@ class TestConnectionCleanup:
 
     def test_connection_cleanup(self, mock_transport, mock_sftp_client):
         """Test that connections are properly closed after run (even with StepFailed)."""
-        settings = SFTPManualMarkdownSettings(
-            HOST="test.example.com",
-            USERNAME="testuser",
-            PASSWORD=SecretStr("testpass"),
-            REMOTE_PATH="/remote/path",
-        )
+        settings = _settings(**_BASE_SETTINGS)
 
         mock_sftp_client.listdir_attr.return_value = []
 
-        with patch("paramiko.Transport", return_value=mock_transport):
-            with patch("paramiko.SFTPClient.from_transport", return_value=mock_sftp_client):
-                step = create_step_with_settings(settings)
-
-                # Will raise StepFailed due to no files
-                with pytest.raises(StepFailed):
-                    step.run(None)
-
-                # Verify cleanup still happened
-                mock_sftp_client.close.assert_called_once()
-                mock_transport.close.assert_called_once()
-
-    def test_connection_cleanup_on_error(self, mock_transport, mock_sftp_client):
-        """Test that connections are closed even when errors occur."""
-        settings = SFTPManualMarkdownSettings(
-            HOST="test.example.com",
-            USERNAME="testuser",
-            PASSWORD=SecretStr("testpass"),
-            REMOTE_PATH="/remote/path",
-        )
-
-        mock_sftp_client.listdir_attr.side_effect = Exception("Error during operation")
-
-        with patch("paramiko.Transport", return_value=mock_transport):
-            with patch("paramiko.SFTPClient.from_transport", return_value=mock_sftp_client):
-                step = create_step_with_settings(settings)
-
-                with pytest.raises(Exception):
-                    step.run(None)
-
-                # Verify cleanup still happened
-                mock_sftp_client.close.assert_called_once()
-                mock_transport.close.assert_called_once()
-
-
-class TestSSHKeyTypes:
-    """Tests for different SSH key types."""
-
-    def test_multiple_key_types(self, mock_transport, mock_sftp_client):
-        """Test loading different SSH key types (RSA, Ed25519, ECDSA)."""
-        settings = SFTPManualMarkdownSettings(
-            HOST="test.example.com",
-            USERNAME="testuser",
-            PRIVATE_KEY_PATH="/path/to/key",
-            REMOTE_PATH="/remote/path",
-        )
-
-        mock_sftp_client.listdir_attr.return_value = []
-        mock_key = MagicMock(spec=paramiko.Ed25519Key)
-
-        with patch("paramiko.Transport", return_value=mock_transport):
-            with patch("paramiko.SFTPClient.from_transport", return_value=mock_sftp_client):
-                # Simulate RSA failing, Ed25519 succeeding
-                with patch(
-                    "paramiko.RSAKey.from_private_key_file",
-                    side_effect=paramiko.SSHException("Not an RSA key"),
-                ):
-                    with patch("paramiko.Ed25519Key.from_private_key_file", return_value=mock_key):
-                        step = create_step_with_settings(settings)
+        with paramiko_patches(mock_transport, mock_sftp_client):
+            step = create_step_with_settings(settings)
 
-                        # Will raise StepFailed due to no files
-                        with pytest.raises(StepFailed):
-                            step.run(None)
+            # Will raise StepFailed due to no files
+            with pytest.raises(StepFailed):
+                step.run(None)
 
-                        # Verify Ed25519 key was used
-                        call_kwargs = mock_transport.connect.call_args.kwargs
-                        assert call_kwargs["pkey"] == mock_key
+            # Verify cleanup still happened
+            mock_sftp_client.close.assert_called_once()
+            mock_transport.close.assert_called_once()
 
 
 class TestEdgeCases:
@@ -547,12 +394,7 @@ class TestEdgeCases:
 
     def test_utf8_decoding(self, mock_transport, mock_sftp_client):
         """Test handling of UTF-8 encoded markdown files."""
-        settings = SFTPManualMarkdownSettings(
-            HOST="test.example.com",
-            USERNAME="testuser",
-            PASSWORD=SecretStr("testpass"),
-            REMOTE_PATH="/remote/path",
-        )
+        settings = _settings(**_BASE_SETTINGS)
 
         # Content with UTF-8 characters
         utf8_content = """---
@@ -561,41 +403,34 @@ keywords: "test,unicode"
 # UTF-8 Test
 Content with émojis 🎉 and spëcial çharacters."""
 
-        mock_sftp_client.listdir_attr.return_value = [MockSFTPAttributes("test.md", is_dir=False)]
+        mock_sftp_client.listdir_attr.return_value = TEST_MD_LISTING
         mock_sftp_client.open.return_value = MockSFTPFile(utf8_content)
 
-        with patch("paramiko.Transport", return_value=mock_transport):
-            with patch("paramiko.SFTPClient.from_transport", return_value=mock_sftp_client):
-                step = create_step_with_settings(settings)
-                results = step.run(None)
+        with paramiko_patches(mock_transport, mock_sftp_client):
+            step = create_step_with_settings(settings)
+            results = step.run(None)
 
-                assert len(results) == 1
-                # MarkdownDataContract uses 'md' not 'content'
-                assert "🎉" in results[0].md
+            assert len(results) == 1
+            # MarkdownDataContract uses 'md' not 'content'
+            assert "🎉" in results[0].md
 
     def test_st_mode_none_handling(self, mock_transport, mock_sftp_client):
         """Test handling of SFTP attributes with None st_mode."""
-        settings = SFTPManualMarkdownSettings(
-            HOST="test.example.com",
-            USERNAME="testuser",
-            PASSWORD=SecretStr("testpass"),
-            REMOTE_PATH="/remote/path",
-        )
+        settings = _settings(**_BASE_SETTINGS)
 
         # Create attribute with None st_mode
-        attr = MockSFTPAttributes("test.md", is_dir=False)
+        attr = sftp_attributes("test.md", is_dir=False)
         attr.st_mode = None
 
         mock_sftp_client.listdir_attr.return_value = [attr]
-        mock_sftp_client.open.return_value = MockSFTPFile(MARKDOWN_NO_METADATA)
+        mock_sftp_client.open.return_value = MockSFTPFile(MARKDOWN_NO_METADATA_BYTES)
 
-        with patch("paramiko.Transport", return_value=mock_transport):
-            with patch("paramiko.SFTPClient.from_transport", return_value=mock_sftp_client):
-                step = create_step_with_settings(settings)
-                results = step.run(None)
+        with paramiko_patches(mock_transport, mock_sftp_client):
+            step = create_step_with_settings(settings)
+            results = step.run(None)
 
-                # Should still load the file (treating None as regular file)
-                assert len(results) == 1
+            # Should still load the file (treating None as regular file)
+            assert len(results) == 1
 
 
 class TestSettings:
@@ -603,16 +438,10 @@ class TestSettings:
 
     def test_sftp_client_creation_failure(self, mock_transport):
         """Test handling of SFTP client creation failure."""
-        settings = SFTPManualMarkdownSettings(
-            HOST="test.example.com",
-            USERNAME="testuser",
-            PASSWORD=SecretStr("testpass"),
-            REMOTE_PATH="/remote/path",
-        )
-
-        with patch("paramiko.Transport", return_value=mock_transport):
-            with patch("paramiko.SFTPClient.from_transport", side_effect=Exception("SFTP creation failed")):
-                step = create_step_with_settings(settings)
-
-                with pytest.raises(Exception, match="SFTP creation failed"):
-                    step.run(None)
+        settings = _settings(**_BASE_SETTINGS)
+
+        with paramiko_patches(mock_transport, Exception("SFTP creation failed")):
+            step = create_step_with_settings(settings)
+
+            with pytest.raises(Exception, match="SFTP creation failed"):
+                step.run(None)
@@ -1,7 +1,6 @@
 # SPDX-FileCopyrightText: 2025 Deutsche Telekom AG (opensource@telekom.de)
 #
 # SPDX-License-Identifier: Apache-2.0
-import shutil
 from pathlib import Path
 
 import pytest
@@ -15,14 +14,17 @@ from wurzel.executors import BaseStepExecutor
 from wurzel.steps.splitter import SimpleSplitterStep
 
 
+@pytest.fixture(scope="session")
+def markdown_input_folder(tmp_path_factory, place_test_data) -> Path:
+    """Read-only input folder holding `markdown.json`, placed once per session."""
+    input_folder = tmp_path_factory.mktemp("md_input")
+    place_test_data("markdown.json", input_folder / "markdown.json")
+    return input_folder
+
+
 @pytest.fixture
-def default_markdown_data(tmp_path):
-    mock_file = Path("tests/data/markdown.json")
-    input_folder = tmp_path / "input"
-    input_folder.mkdir()
-    shutil.copy(mock_file, input_folder)
-    output_folder = tmp_path / "out"
-    return (input_folder, output_folder)
+def default_markdown_data(markdown_input_folder, tmp_path):
+    return (markdown_input_folder, tmp_path / "out")
 
 
 def test_simple_splitter_step(default_markdown_data, env):
@@ -34,7 +36,7 @@ def test_simple_splitter_step(default_markdown_data, env):
     input_folder, output_folder = default_markdown_data
     step_res = BaseStepExecutor(dont_encapsulate=False).execute_step(SimpleSplitterStep, [input_folder], output_folder)
     assert output_folder.is_dir()
-    assert len(list(output_folder.glob("*"))) > 0
+    assert any(output_folder.iterdir())
 
     step_output, step_report = step_res[0]
 
@@ -37,6 +37,22 @@ def test_tiktoken_accepts_raw_encoding_name():
     assert tok.decode(ids) == text
 
 
+@pytest.mark.skipif(tiktoken_missing, reason="tiktoken not installed")
+def test_tiktoken_count_tokens_matches_encode():
+    tok = Tokenizer.from_name("gpt-3.5-turbo")
+    text = "# Heading\n\nSome markdown text with [a link](https://example.com)."
+    assert tok.count_tokens(text) == len(tok.encode(text))
+
+
+@pytest.mark.skipif(tiktoken_missing, reason="tiktoken not installed")
+def test_tiktoken_count_tokens_special_token_text():
+    tok = Tokenizer.from_name("gpt-3.5-turbo")
+    text = "before <|endoftext|> after"
+    with pytest.raises(ValueError):
+        tok.encode(text)
+    assert tok.count_tokens(text) == len(tok.encode(text, disallowed_special=()))
+
+
 @pytest.mark.skipif(transformers_missing, reason="transformers not installed")
 def test_from_name_routes_to_hf_for_non_openai_name():
     tok = Tokenizer.from_name("intfloat/multilingual-e5-large")  # not an OpenAI model
@@ -84,3 +100,11 @@ def test_hf_decode_without_special_tokens(text):
     decoded_text = tok.decode(ids)
 
     assert text == decoded_text, "Decoded text does not match input text"
+
+
+@pytest.mark.skipif(transformers_missing, reason="transformers not installed")
+def test_from_name_reuses_loaded_hf_tokenizer():
+    first = Tokenizer.from_name("intfloat/multilingual-e5-large")
+    second = Tokenizer.from_name("intfloat/multilingual-e5-large")
+    assert first is not second
+    assert first._tok is second._tok
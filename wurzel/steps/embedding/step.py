@@ -31,6 +31,9 @@ from .settings import EmbeddingSettings
 
 log = getLogger(__name__)
 
+# Percentiles reported by `log_statistics` (50 is the median)
+_STATISTICS_PERCENTILES = (5, 25, 50, 75, 95)
+
 # Precompile regex patterns for performance
 _WHITESPACE_PATTERN = re.compile(r"([.,!?]+)?\s+")
 _URL_PATTERN = re.compile(r"https?://(?:www\.)?[-a-zA-Z0-9@:%._+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b(?:[-a-zA-Z0-9()@:%_+.~#?&/=]*)")
@@ -103,17 +106,20 @@ class BaseEmbeddingStep(TypedStep[EmbeddingSettings, list[MarkdownDataContract],
         }
 
         if len(series) > 0:
+            # single sort for all order statistics; std derived from var
+            p5, p25, median, p75, p95 = np.percentile(series, _STATISTICS_PERCENTILES)
+            var = np.var(series)
             stats.update(
                 {
                     "mean": np.mean(series),
-                    "median": np.median(series),
-                    "std": np.std(series),
-                    "var": np.var(series),
+                    "median": median,
+                    "std": np.sqrt(var),
+                    "var": var,
                     "min": np.min(series),
-                    "percentile_5": np.percentile(series, 5),
-                    "percentile_25": np.percentile(series, 25),
-                    "percentile_75": np.percentile(series, 75),
-                    "percentile_95": np.percentile(series, 95),
+                    "percentile_5": p5,
+                    "percentile_25": p25,
+                    "percentile_75": p75,
+                    "percentile_95": p95,
                     "max": np.max(series),
                 }
             )
@@ -299,10 +305,13 @@ class TruncatedEmbeddingStep(BaseEmbeddingStep):
     steps truncates all inputs such that the max. token count is fulfiled.
     """
 
+    tokenizer: Tokenizer
+
     def __init__(self) -> None:
         super().__init__()
 
-        self.tokenizer = Tokenizer.from_name(self.settings.TOKENIZER_MODEL)
+        # The splitter is built from the same TOKENIZER_MODEL setting; reuse its tokenizer instead of loading it twice
+        self.tokenizer = self.splitter.tokenizer
 
     def preprocess_inputs(self, inpt: list[MarkdownDataContract]) -> list[MarkdownDataContract]:
         """No custom processing is performed."""
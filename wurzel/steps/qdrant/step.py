@@ -23,6 +23,10 @@ from .data import QdrantResult
 from .retirement import CollectionRetirer
 from .settings import QdrantSettings
 
+# Optional imports
+if HAS_TLSH:
+    from tlsh import hash as tlsh_hash  # pylint: disable=no-name-in-module
+
 log = getLogger(__name__)
 
 
@@ -275,9 +279,6 @@ class QdrantConnectorStep(TypedStep[QdrantSettings, DataFrame[EmbeddingResult],
         hashes = {}
         encoded_text = text.encode(encoding)
         if HAS_TLSH:
-            # pylint: disable=no-name-in-module, import-outside-toplevel
-            from tlsh import hash as tlsh_hash
-
             hashes["text_tlsh_hash"] = tlsh_hash(encoded_text)
         hashes["text_sha256_hash"] = sha256(encoded_text).hexdigest()
         return hashes
@@ -6,6 +6,7 @@
 
 # Standard library imports
 import logging
+import threading
 from typing import Any
 
 import lxml.html
@@ -32,12 +33,20 @@ class ScraperAPIStep(TypedStep[ScraperAPISettings, list[UrlItem], list[MarkdownD
     """
 
     def run(self, inpt: list[UrlItem]) -> list[MarkdownDataContract]:
+        retries = Retry(total=self.settings.RETRY, backoff_factor=0.1, raise_on_status=False, status_forcelist=[403, 500, 502, 503, 504])
+        thread_local = threading.local()
+        sessions: list[requests.Session] = []
+
+        def get_session() -> requests.Session:
+            # requests.Session is not thread-safe, so each worker thread keeps its own
+            # session and reuses its kept-alive connections for all of its URLs
+            if not hasattr(thread_local, "session"):
+                thread_local.session = requests.Session()
+                thread_local.session.mount("https://", HTTPAdapter(max_retries=retries))
+                sessions.append(thread_local.session)
+            return thread_local.session
+
         def fetch_and_process(url_item: UrlItem, recursion_depth=0):
-            session = requests.Session()
-            retries = Retry(
-                total=self.settings.RETRY, backoff_factor=0.1, raise_on_status=False, status_forcelist=[403, 500, 502, 503, 504]
-            )
-            session.mount("https://", HTTPAdapter(max_retries=retries))
             payload = {
                 "api_key": self.settings.TOKEN.get_secret_value(),
                 "url": url_item.url,
@@ -53,7 +62,7 @@ class ScraperAPIStep(TypedStep[ScraperAPISettings, list[UrlItem], list[MarkdownD
             }
             try:
                 r = None  # for short error handling
-                r = session.get(self.settings.API, params=payload, timeout=self.settings.TIMEOUT)
+                r = get_session().get(self.settings.API, params=payload, timeout=self.settings.TIMEOUT)
                 r.raise_for_status()
             except requests.exceptions.ReadTimeout:
                 log.warning(
@@ -82,8 +91,14 @@ class ScraperAPIStep(TypedStep[ScraperAPISettings, list[UrlItem], list[MarkdownD
             progress_bar.update(1)
             return MarkdownDataContract(md=md, url=url_item.url, keywords=url_item.title)
 
-        with tqdm(total=len(inpt), desc="Processing URLs") as progress_bar:
-            results = Parallel(n_jobs=self.settings.CONCURRENCY_NUM, backend="threading")(delayed(fetch_and_process)(item) for item in inpt)
+        try:
+            with tqdm(total=len(inpt), desc="Processing URLs") as progress_bar:
+                results = Parallel(n_jobs=self.settings.CONCURRENCY_NUM, backend="threading")(
+                    delayed(fetch_and_process)(item) for item in inpt
+                )
+        finally:
+            for session in sessions:
+                session.close()
 
         filtered_results = [res for res in results if res]
         if not filtered_results:
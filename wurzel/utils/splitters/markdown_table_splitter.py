@@ -123,7 +123,7 @@ class MarkdownTableSplitterUtil:
             line (str): The line to add to the buffer.
 
         """
-        line_tok = len(self.tokenizer.encode(line))
+        line_tok = self.tokenizer.count_tokens(line)
 
         if self.buf_tok + line_tok > self.token_limit:
             self._flush_buffer()
@@ -146,7 +146,7 @@ class MarkdownTableSplitterUtil:
         header_line, sep_line = lines[start_idx], lines[start_idx + 1]
         header_cells = [c.strip() for c in header_line.strip().strip("|").split("|")]
         sep_cells = [c.strip() for c in sep_line.strip().strip("|").split("|")]
-        header_tok = len(self.tokenizer.encode(header_line + sep_line))
+        header_tok = self.tokenizer.count_tokens(header_line + sep_line)
 
         return header_line, sep_line, header_cells, sep_cells, header_tok
 
@@ -160,7 +160,7 @@ class MarkdownTableSplitterUtil:
             int: Token count for the rendered row.
 
         """
-        return len(self.tokenizer.encode(make_row(cells)))
+        return self.tokenizer.count_tokens(make_row(cells))
 
     # pylint: disable=too-many-positional-arguments
     def _slice_long_row(
@@ -207,7 +207,7 @@ class MarkdownTableSplitterUtil:
             if col_idx < len(row_cells) and self.repeat_header_row:
                 self.buf.extend([header_line, sep_line])
                 # Update buf_tok for the next iteration
-                self.buf_tok = len(self.tokenizer.encode(header_line + sep_line))
+                self.buf_tok = self.tokenizer.count_tokens(header_line + sep_line)
             else:
                 self.buf.clear()
                 self.buf_tok = 0
@@ -368,7 +368,7 @@ class MarkdownTableSplitterUtil:
         self._reset_state()
 
         input_length = len(md)
-        input_tokens = len(self.tokenizer.encode(md))
+        input_tokens = self.tokenizer.count_tokens(md)
         table_count = self._count_tables_in_text(md)
 
         lines = md.splitlines(keepends=True)
@@ -411,7 +411,7 @@ class MarkdownTableSplitterUtil:
         if not self.chunks:
             return SplittingOperationMetrics()
 
-        token_counts = [len(self.tokenizer.encode(chunk)) for chunk in self.chunks]
+        token_counts = [self.tokenizer.count_tokens(chunk) for chunk in self.chunks]
         total_chars = sum(len(chunk) for chunk in self.chunks)
         total_tokens = sum(token_counts)
 
@@ -218,7 +218,7 @@ class SemanticSplitter:
             int: count of tokens
 
         """
-        return len(self.tokenizer.encode(text))
+        return self.tokenizer.count_tokens(text)
 
     def _cut_to_tokenlen(self, text: str, token_len: int, return_discarded_text: bool = False) -> str | tuple[str, str]:
         """Cut text to max. token length using the current tokenizer.
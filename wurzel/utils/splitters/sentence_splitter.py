@@ -5,6 +5,7 @@ import importlib.util
 import logging
 import re
 from abc import ABC, abstractmethod
+from functools import cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -12,6 +13,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Standard pipeline components that never set sentence boundaries; disabled since only `Doc.sents` is read
+_SPACY_UNUSED_PIPES = frozenset({"tagger", "morphologizer", "lemmatizer", "attribute_ruler", "ner"})
+
 
 def download_sentence_splitter_model(model_name: str):
     """Download the SentenceSplitterModel model by name."""
@@ -27,6 +31,34 @@ def download_sentence_splitter_model(model_name: str):
         raise OSError(f"Failed to download SpaCy model '{model_name}' via spacy CLI") from e
 
 
+@cache
+def _load_spacy_model(name: str) -> "spacy.language.Language":
+    """Load a Spacy model by name (downloading it if needed), cached per process.
+
+    Loading a Spacy pipeline takes several hundred milliseconds; the pipeline is only
+    used for inference, so splitters created with the same name share one instance.
+    Known components not involved in sentence segmentation (tagger, NER, lemmatizer, ...)
+    are disabled; all other components, including custom ones, keep running.
+    """
+    import spacy  # pylint: disable=import-outside-toplevel
+
+    spec = importlib.util.find_spec(name)
+
+    if spec is None:
+        # Try to download the model if not found
+        download_sentence_splitter_model(name)
+        spec = importlib.util.find_spec(name)
+        if spec is None:
+            raise OSError(f"Sentence splitter '{name}' is not installed and could not be loaded.")
+
+    # Try Spacy model name, like "en_core_web_sm"
+    nlp = spacy.load(name)
+    for pipe_name in nlp.pipe_names:
+        if pipe_name in _SPACY_UNUSED_PIPES:
+            nlp.disable_pipe(pipe_name)
+    return nlp
+
+
 class SentenceSplitter(ABC):
     """Abstract base class for sentence splitter.
 
@@ -76,19 +108,7 @@ class SentenceSplitter(ABC):
 
         # Try to load a Spacy model
         try:
-            import spacy  # pylint: disable=import-outside-toplevel
-
-            spec = importlib.util.find_spec(name)
-
-            if spec is None:
-                # Try to download the model if not found
-                download_sentence_splitter_model(name)
-                spec = importlib.util.find_spec(name)
-                if spec is None:
-                    raise OSError(f"Sentence splitter '{name}' is not installed and could not be loaded.")
-
-            # Try Spacy model name, like "en_core_web_sm"
-            nlp = spacy.load(name)
+            nlp = _load_spacy_model(name)
 
             return SpacySentenceSplitter(nlp)
 
@@ -4,6 +4,7 @@
 # pylint: disable=duplicate-code
 import logging
 from abc import ABC, abstractmethod
+from functools import cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -13,6 +14,18 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@cache
+def _load_hf_tokenizer(name: str) -> "transformers.PreTrainedTokenizerBase":
+    """Load a Hugging Face tokenizer by name, cached per process.
+
+    Unlike `tiktoken.get_encoding`, which keeps its own registry of loaded encodings,
+    `AutoTokenizer.from_pretrained` reads the vocabulary from disk on every call.
+    """
+    from transformers import AutoTokenizer  # pylint: disable=import-outside-toplevel
+
+    return AutoTokenizer.from_pretrained(name)
+
+
 class Tokenizer(ABC):
     """Abstract base class for text tokenizers.
 
@@ -49,6 +62,17 @@ class Tokenizer(ABC):
         """
         raise NotImplementedError
 
+    def count_tokens(self, text: str) -> int:
+        """Count the tokens of a text without keeping the token IDs.
+
+        Args:
+            text: The input string to tokenize.
+
+        Returns:
+            The number of tokens.
+        """
+        return len(self.encode(text))
+
     def limit_token_count(self, text: str, max_token_count: int, return_discarded_text: bool = False) -> str | tuple[str, str]:
         """Enforces a max. token limit on the input text, i.e., the input text is cut-off at the max. token count.
 
@@ -117,10 +141,7 @@ class Tokenizer(ABC):
 
         # Defaulting to HF tokenizer
         try:
-            from transformers import AutoTokenizer  # pylint: disable=import-outside-toplevel
-
-            hf_tok = AutoTokenizer.from_pretrained(name)
-            return HFTokenizer(hf_tok)
+            return HFTokenizer(_load_hf_tokenizer(name))
 
         except ImportError as e:
             raise RuntimeError(f"Could not load tokenizer '{name}': tiktoken or transformers is not installed.") from e
@@ -145,6 +166,14 @@ class TiktokenTokenizer(Tokenizer):
         """Convert token IDs back into text."""
         return self._enc.decode(tokens, **kwargs)
 
+    def count_tokens(self, text: str) -> int:
+        """Count tokens, skipping the special-token scan `encode` runs on every call.
+
+        NOTE: Unlike `encode`, special-token strings (e.g. `<|endoftext|>`) do not raise
+        but are counted as plain text.
+        """
+        return len(self._enc.encode_ordinary(text))
+
 
 class HFTokenizer(Tokenizer):
     """Adapter for Hugging Face `PreTrainedTokenizerBase` objects."""